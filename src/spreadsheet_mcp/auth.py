@@ -1,10 +1,20 @@
 """Google Service Account Authentication for Sheets API."""
 
+import gzip
+import logging
 import os
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 
+import google_auth_httplib2
+import httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build, Resource
+from googleapiclient.http import HttpRequest
+
+logger = logging.getLogger(__name__)
 
 # Scopes required for full Sheets API access
 SCOPES = [
@@ -15,25 +25,39 @@ SCOPES = [
 
 def get_credentials_path() -> Path:
     """Get the path to the service account credentials file."""
-    # Check environment variable first
-    env_path = os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE")
-    if env_path:
-        path = Path(env_path)
-        if path.exists():
-            return path
-
-    # Check common locations
-    common_paths = [
-        Path("./credentials/service-account.json"),
-        Path("./credentials/service-cred.json"),  # Support existing file
-        Path("./service-account.json"),
-        Path("./service-cred.json"),
-        Path.home() / ".config" / "spreadsheet-mcp" / "service-account.json",
-    ]
-
-    for path in common_paths:
-        if path.exists():
-            return path
+    # Keyed on the env var so changing it picks up a different file
+    return _find_credentials_path(os.environ.get("GOOGLE_SERVICE_ACCOUNT_FILE"))
+
+
+# Locations checked, in order, when GOOGLE_SERVICE_ACCOUNT_FILE is not usable
+_COMMON_PATHS = (
+    Path("./credentials/service-account.json"),
+    Path("./credentials/service-cred.json"),  # Support existing file
+    Path("./service-account.json"),
+    Path("./service-cred.json"),
+    Path.home() / ".config" / "spreadsheet-mcp" / "service-account.json",
+)
+
+
+@lru_cache(maxsize=1)
+def _find_credentials_path(env_path: str | None) -> Path:
+    """Locate the credentials file (cached per GOOGLE_SERVICE_ACCOUNT_FILE value).
+
+    Only a found path is cached: lru_cache does not keep the FileNotFoundError,
+    so each failed lookup checks every location again and a file added later is
+    picked up without a restart.
+    """
+    # Check environment variable first, then common locations
+    candidates = (Path(env_path), *_COMMON_PATHS) if env_path else _COMMON_PATHS
+
+    for path in candidates:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        # Absolute, so every spelling of the same file shares one cached
+        # credentials object, service and transport set, whatever the cwd
+        return path.resolve()
 
     raise FileNotFoundError(
         "Service account credentials not found. "
@@ -44,7 +68,12 @@ def get_credentials_path() -> Path:
 
 def get_credentials() -> service_account.Credentials:
     """Load and return Google service account credentials."""
-    credentials_path = get_credentials_path()
+    return _load_credentials(get_credentials_path())
+
+
+@lru_cache(maxsize=1)
+def _load_credentials(credentials_path: Path) -> service_account.Credentials:
+    """Parse the service account file once per credentials path."""
     credentials = service_account.Credentials.from_service_account_file(
         str(credentials_path), scopes=SCOPES
     )
@@ -53,13 +82,198 @@ def get_credentials() -> service_account.Credentials:
 
 def get_sheets_service() -> Resource:
     """Build and return the Google Sheets API service."""
-    credentials = get_credentials()
-    service = build("sheets", "v4", credentials=credentials)
-    return service
+    return _build_service("sheets", "v4", get_credentials_path())
 
 
 def get_drive_service() -> Resource:
     """Build and return the Google Drive API service (for creating spreadsheets)."""
-    credentials = get_credentials()
-    service = build("drive", "v3", credentials=credentials)
+    return _build_service("drive", "v3", get_credentials_path())
+
+
+def start_warmup() -> None:
+    """Load credentials and build services on a background thread.
+
+    Disabled by setting SPREADSHEET_MCP_EAGER=0.
+    """
+    if os.environ.get("SPREADSHEET_MCP_EAGER", "1") == "0":
+        return
+    threading.Thread(target=_warm_up, name="warmup", daemon=True).start()
+
+
+def _warm_up() -> None:
+    """Prime the credential, token and service caches before the first tool call."""
+    try:
+        get_sheets_service()
+        get_drive_service()
+        # Fetch the first access token now instead of on the first API request
+        get_credentials().refresh(google_auth_httplib2.Request(httplib2.Http()))
+    except Exception:
+        # The tool call that needs the service reports the real error; this is
+        # only for diagnosing setup problems
+        logger.debug("Background warm-up failed", exc_info=True)
+
+
+# httplib2.Http is not thread-safe, so each thread gets its own keep-alive
+# transport (shared by the Sheets and Drive services on that thread).
+_thread_local = threading.local()
+
+
+def _get_authorized_http(credentials_path: Path) -> google_auth_httplib2.AuthorizedHttp:
+    """Return this thread's authorized HTTP transport for the given credentials.
+
+    httplib2 keeps connections alive per host, so reusing one transport per
+    thread means repeated API calls reuse the open TLS connection instead of
+    paying a fresh handshake each time.
+    """
+    transports = getattr(_thread_local, "transports", None)
+    if transports is None:
+        transports = _thread_local.transports = {}
+    http = transports.get(credentials_path)
+    if http is None:
+        credentials = _load_credentials(credentials_path)
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+        transports[credentials_path] = http
+    return http
+
+
+# Request bodies at least this large are gzip-compressed when
+# SPREADSHEET_MCP_GZIP_REQUESTS=1 (e.g. big write_cells/batch_write uploads)
+GZIP_MIN_BODY_BYTES = 4096
+
+
+# Client-side cap on Sheets API calls. Sheets counts reads and writes against
+# separate per-user quotas of 60 requests a minute (a service account is one
+# user), so each gets its own bucket. A full bucket lets a burst through
+# without waiting; the refill rate leaves room for it, so no 60-second window
+# sees more than REQUESTS_PER_MINUTE reads or writes.
+# SPREADSHEET_MCP_REQUESTS_PER_MINUTE=0 turns throttling off, leaving rate
+# limits to the 429 backoff in execute(num_retries=...).
+REQUESTS_PER_MINUTE = int(os.environ.get("SPREADSHEET_MCP_REQUESTS_PER_MINUTE", "60"))
+REQUEST_BURST = (
+    int(os.environ.get("SPREADSHEET_MCP_REQUEST_BURST", "10"))
+    if REQUESTS_PER_MINUTE > 0
+    else 0
+)
+REQUESTS_PER_SECOND = max(REQUESTS_PER_MINUTE - REQUEST_BURST, 1) / 60
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: ``rate`` calls a second, bursts of ``burst``.
+
+    A bucket with no burst never waits.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 1) -> None:
+        """Take tokens, sleeping only if the bucket runs out."""
+        if self._burst <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # The token is reserved under the lock, so waiters queue up in order
+            self._tokens -= tokens
+            wait = -self._tokens / self._rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Shared by every Sheets request the services build; batched calls take one
+# token per call they carry. Drive calls have their own, far larger quota.
+read_limiter = _TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+write_limiter = _TokenBucket(REQUESTS_PER_SECOND, REQUEST_BURST)
+_unthrottled = _TokenBucket(1.0, 0)
+
+
+def rate_limiter_for(method: str) -> _TokenBucket:
+    """The bucket a Sheets call counts against: GETs are reads, the rest writes."""
+    return read_limiter if method == "GET" else write_limiter
+
+
+class _ThrottledRequest(HttpRequest):
+    """HttpRequest that takes a rate-limit token for every attempt it sends.
+
+    Rate-limit (429) responses are still retried by execute(num_retries=...)
+    with googleapiclient's exponential backoff. The retry loop waits through
+    self._sleep before each new attempt, so that is where a retry takes its
+    token.
+
+    With gzip_body, a large body is compressed when the request is executed
+    on its own. Calls added to a BatchHttpRequest are never executed
+    themselves and are written into a text multipart body, so they stay
+    uncompressed.
+    """
+
+    def __init__(
+        self, *args, gzip_body: bool = False, throttled: bool = True, **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self._sleep = self._backoff
+        self._gzip_body = gzip_body
+        self._limiter = rate_limiter_for(self.method) if throttled else _unthrottled
+
+    def _backoff(self, seconds: float) -> None:
+        time.sleep(seconds)
+        self._limiter.acquire()
+
+    def _compress_body(self) -> None:
+        """Gzip a large body in place, the first time the request is sent."""
+        self._gzip_body = False
+        body = self.body
+        if body and len(body) >= GZIP_MIN_BODY_BYTES:
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            self.body = gzip.compress(body, compresslevel=1)
+            self.body_size = len(self.body)
+            self.headers["content-encoding"] = "gzip"
+            self.headers["content-length"] = str(self.body_size)
+
+    def execute(self, http=None, num_retries=0):
+        if self._gzip_body:
+            self._compress_body()
+        self._limiter.acquire()
+        return super().execute(http=http, num_retries=num_retries)
+
+
+def _thread_request_builder(credentials_path: Path, throttled: bool):
+    """Make a requestBuilder that sends requests on the calling thread's transport.
+
+    throttled requests count against the Sheets read and write buckets.
+    """
+    gzip_bodies = os.environ.get("SPREADSHEET_MCP_GZIP_REQUESTS", "0") == "1"
+
+    def build_request(http, *args, **kwargs) -> HttpRequest:
+        return _ThrottledRequest(
+            _get_authorized_http(credentials_path),
+            *args,
+            gzip_body=gzip_bodies,
+            throttled=throttled,
+            **kwargs,
+        )
+
+    return build_request
+
+
+@lru_cache(maxsize=2)
+def _build_service(name: str, version: str, credentials_path: Path) -> Resource:
+    """Build an API service once per (API, credentials file) pair."""
+    # Use the discovery documents bundled with google-api-python-client rather
+    # than fetching them over HTTPS, and skip the on-disk discovery cache.
+    service = build(
+        name,
+        version,
+        http=_get_authorized_http(credentials_path),
+        requestBuilder=_thread_request_builder(credentials_path, name == "sheets"),
+        static_discovery=True,
+        cache_discovery=False,
+    )
     return service
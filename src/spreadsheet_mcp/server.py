@@ -1,69 +1,129 @@
 """Google Sheets MCP Server - FastMCP implementation with all tools."""
 
+import asyncio
+import functools
 import json
+import re
+from importlib import resources
+
+import anyio
 from mcp.server.fastmcp import FastMCP
 
-from .sheets_client import get_client
+from .auth import start_warmup
+from .sheets_client import BatchWriteItem, get_client
+
+
+def _load_instructions() -> str:
+    """Read the server instructions shipped alongside this module."""
+    return (
+        resources.files(__package__)
+        .joinpath("instructions.md")
+        .read_text(encoding="utf-8")
+    )
+
 
 # Initialize the MCP server
-mcp = FastMCP(
-    "Google Sheets",
-    instructions="""
-Google Sheets MCP Server - Full spreadsheet manipulation capabilities.
-
-## Getting Started
-1. Get spreadsheet_id from URL: https://docs.google.com/spreadsheets/d/SPREADSHEET_ID/edit
-2. Use get_spreadsheet_info first to see available sheets and their IDs
-3. Use A1 notation for ranges (examples below)
-
-## A1 Notation Reference
-- "Sheet1!A1:D10" - Cells A1 to D10 in Sheet1
-- "Sheet1!A:A" - Entire column A
-- "Sheet1!1:5" - Rows 1 through 5
-- "A1:B5" - Range in first visible sheet
-- "'My Sheet'!A1" - Sheet names with spaces need quotes
-
-## Common Workflows
-
-### Reading Data
-1. Use read_cells to get values from a range
-2. Use batch_read for multiple ranges at once
-3. Use get_last_row to find where data ends
-
-### Writing Data
-1. Use write_cells for single range (supports formulas like "=SUM(A1:A10)")
-2. Use batch_write for multiple ranges
-3. Use append_rows to add data at the end
-
-### Formulas
-Write formulas as string values starting with "=":
-- "=SUM(A1:A10)" - Sum values
-- "=AVERAGE(B:B)" - Average entire column
-- "=VLOOKUP(A1,Sheet2!A:B,2,FALSE)" - Lookup values
-- "=IF(A1>100,\"High\",\"Low\")" - Conditional logic
-
-### Formatting
-Use format_cells with 0-based row/column indices:
-- Row 1 = index 0, Column A = index 0
-- end_row/end_col are exclusive (row 0-1 means just row 0)
-
-### Charts
-1. First write your data to the sheet
-2. Use create_chart with chart_type: BAR, LINE, PIE, COLUMN, AREA, SCATTER
-3. Charts are positioned by row/column offset
-
-### Sharing
-Use share_spreadsheet to:
-- Share with specific email (role: reader/writer/commenter)
-- Make public with make_public=True
-
-## Tips
-- Always check get_spreadsheet_info first to get sheet_id values
-- sheet_id is numeric (e.g., 0, 123456), sheet name is text (e.g., "Sheet1")
-- Row/column indices in formatting are 0-based
-- A1 notation in read/write is 1-based (A1 is first cell)
-""",
-)
+mcp = FastMCP("Google Sheets", instructions=_load_instructions())
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+# One comma-separated item with surrounding whitespace excluded
+_CSV_ITEM = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
+def _split_csv(text: str) -> list[str]:
+    """Split a comma-separated argument into stripped, non-empty items."""
+    return _CSV_ITEM.findall(text)
+
+
+# Upper bound on Sheets/Drive requests in flight at once, to stay inside the
+# per-user API quota when a client fires many tool calls concurrently
+_api_limiter = anyio.CapacityLimiter(10)
+
+
+async def _run(method: str, *args, **kwargs):
+    """Call the named SheetsClient method on the shared client in a worker thread.
+
+    This is the single dispatch path for every tool. Running the blocking
+    call off the event loop lets concurrent tool calls overlap instead of
+    queueing behind each other; _api_limiter caps how many overlap.
+    """
+    call = functools.partial(getattr(get_client(), method), *args, **kwargs)
+    return await anyio.to_thread.run_sync(call, limiter=_api_limiter)
+
+
+def _success(message: str) -> str:
+    """Build the {"success": true, "message": ...} reply."""
+    return json.dumps({"success": True, "message": message})
+
+
+def _hex_to_rgb(hex_color: str) -> dict | None:
+    """Convert a hex color like "#4285F4" to a Sheets RGB dict (None if invalid)."""
+    rgb = _hex_to_rgb_components(hex_color)
+    if rgb is None:
+        return None
+    return {"red": rgb[0], "green": rgb[1], "blue": rgb[2]}
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb_components(hex_color: str) -> tuple[float, float, float] | None:
+    """Parse a hex color once; palettes repeat, so results are cached."""
+    if not hex_color:
+        return None
+    hex_color = hex_color.lstrip("#")
+    if len(hex_color) != 6:
+        return None
+    r, g, b = bytes.fromhex(hex_color)
+    return (r / 255, g / 255, b / 255)
+
+
+def _parse_rows(values: str) -> list[list]:
+    """Decode a JSON 2D array argument, rejecting bad shapes before any API call."""
+    rows = json.loads(values)
+    if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+        raise ValueError("values must be a JSON 2D array, e.g. [[1, 2], [3, 4]]")
+    return rows
+
+
+# Keys of a ValueRange that batch_write accepts
+_BATCH_ITEM_KEYS = {"range", "values", "majorDimension"}
+
+
+def _parse_batch_data(data: str) -> list[BatchWriteItem]:
+    """Decode and validate a batch_write payload in a single pass.
+
+    Each item must be an object with a string 'range' and a 2D 'values'
+    array, plus an optional 'majorDimension' of "ROWS" or "COLUMNS". Any
+    other key is rejected rather than dropped.
+    """
+    items = json.loads(data)
+    if not isinstance(items, list):
+        raise ValueError("data must be a JSON array of {range, values} objects")
+
+    batch: list[BatchWriteItem] = []
+    for i, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"data[{i}] must be an object with 'range' and 'values'")
+        range_notation = item.get("range")
+        rows = item.get("values")
+        if not isinstance(range_notation, str) or not range_notation:
+            raise ValueError(f"data[{i}].range must be a non-empty A1 notation string")
+        if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+            raise ValueError(f"data[{i}].values must be a JSON 2D array")
+        unknown = item.keys() - _BATCH_ITEM_KEYS
+        if unknown:
+            raise ValueError(f"data[{i}] has unsupported keys: {sorted(unknown)}")
+        entry: BatchWriteItem = {"range": range_notation, "values": rows}
+        if "majorDimension" in item:
+            if item["majorDimension"] not in ("ROWS", "COLUMNS"):
+                raise ValueError(f"data[{i}].majorDimension must be ROWS or COLUMNS")
+            entry["majorDimension"] = item["majorDimension"]
+        batch.append(entry)
+    return batch
 
 
 # =============================================================================
@@ -72,7 +132,7 @@ Use share_spreadsheet to:
 
 
 @mcp.tool()
-def create_spreadsheet(title: str, sheet_names: str = "") -> str:
+async def create_spreadsheet(title: str, sheet_names: str = "") -> str:
     """Create a new Google Spreadsheet.
 
     Args:
@@ -82,18 +142,13 @@ def create_spreadsheet(title: str, sheet_names: str = "") -> str:
     Returns:
         JSON with spreadsheet_id, title, url, and sheets.
     """
-    client = get_client()
-    sheets = (
-        [s.strip() for s in sheet_names.split(",") if s.strip()]
-        if sheet_names
-        else None
-    )
-    result = client.create_spreadsheet(title, sheets)
+    sheets = _split_csv(sheet_names) or None
+    result = await _run("create_spreadsheet", title, sheets)
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def get_spreadsheet_info(spreadsheet_id: str) -> str:
+async def get_spreadsheet_info(spreadsheet_id: str) -> str:
     """Get information about a spreadsheet including all sheets.
 
     Args:
@@ -102,8 +157,7 @@ def get_spreadsheet_info(spreadsheet_id: str) -> str:
     Returns:
         JSON with spreadsheet metadata, sheets list, and URL.
     """
-    client = get_client()
-    result = client.get_spreadsheet_info(spreadsheet_id)
+    result = await _run("get_spreadsheet_info", spreadsheet_id)
     return json.dumps(result, indent=2)
 
 
@@ -113,7 +167,7 @@ def get_spreadsheet_info(spreadsheet_id: str) -> str:
 
 
 @mcp.tool()
-def list_sheets(spreadsheet_id: str) -> str:
+async def list_sheets(spreadsheet_id: str) -> str:
     """List all sheets/tabs in a spreadsheet.
 
     Args:
@@ -122,13 +176,12 @@ def list_sheets(spreadsheet_id: str) -> str:
     Returns:
         JSON list of sheets with their IDs, titles, and dimensions.
     """
-    client = get_client()
-    result = client.list_sheets(spreadsheet_id)
+    result = await _run("list_sheets", spreadsheet_id)
     return json.dumps(result, indent=2)
 
 
 @mcp.tool()
-def create_sheet(spreadsheet_id: str, title: str, index: int = -1) -> str:
+async def create_sheet(spreadsheet_id: str, title: str, index: int = -1) -> str:
     """Create a new sheet/tab in a spreadsheet.
 
     Args:
@@ -139,14 +192,13 @@ def create_sheet(spreadsheet_id: str, title: str, index: int = -1) -> str:
     Returns:
         JSON with new sheet's ID, title, and index.
     """
-    client = get_client()
     idx = None if index < 0 else index
-    result = client.create_sheet(spreadsheet_id, title, idx)
-    return json.dumps(result, indent=2)
+    result = await _run("create_sheet", spreadsheet_id, title, idx)
+    return json.dumps(result)
 
 
 @mcp.tool()
-def delete_sheet(spreadsheet_id: str, sheet_id: int) -> str:
+async def delete_sheet(spreadsheet_id: str, sheet_id: int) -> str:
     """Delete a sheet from a spreadsheet.
 
     Args:
@@ -156,13 +208,12 @@ def delete_sheet(spreadsheet_id: str, sheet_id: int) -> str:
     Returns:
         Success message.
     """
-    client = get_client()
-    client.delete_sheet(spreadsheet_id, sheet_id)
-    return json.dumps({"success": True, "message": f"Sheet {sheet_id} deleted"})
+    await _run("delete_sheet", spreadsheet_id, sheet_id)
+    return _success(f"Sheet {sheet_id} deleted")
 
 
 @mcp.tool()
-def rename_sheet(spreadsheet_id: str, sheet_id: int, new_title: str) -> str:
+async def rename_sheet(spreadsheet_id: str, sheet_id: int, new_title: str) -> str:
     """Rename a sheet.
 
     Args:
@@ -173,13 +224,12 @@ def rename_sheet(spreadsheet_id: str, sheet_id: int, new_title: str) -> str:
     Returns:
         Success message.
     """
-    client = get_client()
-    client.rename_sheet(spreadsheet_id, sheet_id, new_title)
-    return json.dumps({"success": True, "message": f"Sheet renamed to '{new_title}'"})
+    await _run("rename_sheet", spreadsheet_id, sheet_id, new_title)
+    return _success(f"Sheet renamed to '{new_title}'")
 
 
 @mcp.tool()
-def duplicate_sheet(
+async def duplicate_sheet(
     spreadsheet_id: str, sheet_id: int, new_title: str, insert_index: int = -1
 ) -> str:
     """Duplicate/copy a sheet within the same spreadsheet.
@@ -193,10 +243,9 @@ def duplicate_sheet(
     Returns:
         JSON with new sheet's ID, title, and index.
     """
-    client = get_client()
     idx = None if insert_index < 0 else insert_index
-    result = client.duplicate_sheet(spreadsheet_id, sheet_id, new_title, idx)
-    return json.dumps(result, indent=2)
+    result = await _run("duplicate_sheet", spreadsheet_id, sheet_id, new_title, idx)
+    return json.dumps(result)
 
 
 # =============================================================================
@@ -205,28 +254,42 @@ def duplicate_sheet(
 
 
 @mcp.tool()
-def read_cells(spreadsheet_id: str, range_notation: str) -> str:
+async def read_cells(
+    spreadsheet_id: str,
+    range_notation: str,
+    value_render_option: str = "FORMATTED_VALUE",
+) -> str:
     """Read cell values from a spreadsheet range.
 
     Examples:
         - read_cells("abc123", "Sheet1!A1:D10") → Read 10 rows, 4 columns
         - read_cells("abc123", "Sheet1!A:A") → Read entire column A
         - read_cells("abc123", "A1:B5") → Read from first visible sheet
+        - read_cells("abc123", "Sheet1!B2:B50", "UNFORMATTED_VALUE") → Raw numbers
 
     Args:
         spreadsheet_id: The ID from the spreadsheet URL.
         range_notation: A1 notation range. Use 'SheetName!A1:B5' format.
+        value_render_option: "FORMATTED_VALUE" (as displayed, e.g. "$1,234.50"),
+            "UNFORMATTED_VALUE" (numbers as JSON numbers; best for calculations)
+            or "FORMULA" (formulas instead of their results).
 
     Returns:
         JSON 2D array of cell values. Empty cells may be omitted.
     """
-    client = get_client()
-    result = client.read_cells(spreadsheet_id, range_notation)
-    return json.dumps(result, indent=2)
+    result = await _run(
+        "read_cells", spreadsheet_id, range_notation, value_render_option
+    )
+    return json.dumps(result)
 
 
 @mcp.tool()
-def write_cells(spreadsheet_id: str, range_notation: str, values: str) -> str:
+async def write_cells(
+    spreadsheet_id: str,
+    range_notation: str,
+    values: str,
+    include_values_in_response: bool = False,
+) -> str:
     """Write values to cells. Supports formulas (start with =).
 
     Examples:
@@ -239,53 +302,64 @@ def write_cells(spreadsheet_id: str, range_notation: str, values: str) -> str:
         range_notation: Starting cell in A1 notation (e.g., "Sheet1!A1").
         values: JSON 2D array. Each inner array is a row.
                 Formulas: use "=SUM(A1:A10)", "=AVERAGE(B:B)", etc.
+        include_values_in_response: Also return the written cells as displayed,
+                e.g. computed formula results, instead of reading them back.
 
     Returns:
-        JSON with updated_cells count and updated_range.
+        JSON with updated_cells count and updated_range (and updated_values
+        when include_values_in_response is set).
     """
-    client = get_client()
-    parsed_values = json.loads(values)
-    result = client.write_cells(spreadsheet_id, range_notation, parsed_values)
-    return json.dumps(result, indent=2)
+    parsed_values = _parse_rows(values)
+    result = await _run(
+        "write_cells",
+        spreadsheet_id,
+        range_notation,
+        parsed_values,
+        include_values_in_response=include_values_in_response,
+    )
+    return json.dumps(result)
 
 
 @mcp.tool()
-def batch_read(spreadsheet_id: str, ranges: str) -> str:
+async def batch_read(
+    spreadsheet_id: str, ranges: str, value_render_option: str = "FORMATTED_VALUE"
+) -> str:
     """Read values from multiple ranges at once.
 
     Args:
         spreadsheet_id: The ID of the spreadsheet.
         ranges: Comma-separated A1 notation ranges (e.g., "Sheet1!A1:B5,Sheet1!D1:E5").
+        value_render_option: "FORMATTED_VALUE", "UNFORMATTED_VALUE" or "FORMULA"
+            (see read_cells).
 
     Returns:
         JSON object mapping each range to its values.
     """
-    client = get_client()
-    range_list = [r.strip() for r in ranges.split(",")]
-    result = client.batch_read(spreadsheet_id, range_list)
-    return json.dumps(result, indent=2)
+    range_list = _split_csv(ranges)
+    result = await _run("batch_read", spreadsheet_id, range_list, value_render_option)
+    return json.dumps(result)
 
 
 @mcp.tool()
-def batch_write(spreadsheet_id: str, data: str) -> str:
+async def batch_write(spreadsheet_id: str, data: str) -> str:
     """Write values to multiple ranges at once.
 
     Args:
         spreadsheet_id: The ID of the spreadsheet.
-        data: JSON array of objects with 'range' and 'values' keys.
+        data: JSON array of objects with 'range' and 'values' keys, and
+              optionally 'majorDimension' ("ROWS" or "COLUMNS").
               Example: '[{"range": "A1:B2", "values": [[1,2],[3,4]]}, {"range": "D1", "values": [["Hello"]]}]'
 
     Returns:
         JSON with total cells, rows, columns updated.
     """
-    client = get_client()
-    parsed_data = json.loads(data)
-    result = client.batch_write(spreadsheet_id, parsed_data)
-    return json.dumps(result, indent=2)
+    parsed_data = _parse_batch_data(data)
+    result = await _run("batch_write", spreadsheet_id, parsed_data)
+    return json.dumps(result)
 
 
 @mcp.tool()
-def clear_cells(spreadsheet_id: str, range_notation: str) -> str:
+async def clear_cells(spreadsheet_id: str, range_notation: str) -> str:
     """Clear all values in a range (keeps formatting).
 
     Args:
@@ -295,13 +369,12 @@ def clear_cells(spreadsheet_id: str, range_notation: str) -> str:
     Returns:
         Success message.
     """
-    client = get_client()
-    client.clear_cells(spreadsheet_id, range_notation)
-    return json.dumps({"success": True, "message": f"Cleared range: {range_notation}"})
+    await _run("clear_cells", spreadsheet_id, range_notation)
+    return _success(f"Cleared range: {range_notation}")
 
 
 @mcp.tool()
-def append_rows(spreadsheet_id: str, range_notation: str, values: str) -> str:
+async def append_rows(spreadsheet_id: str, range_notation: str, values: str) -> str:
     """Append rows to the end of data in a sheet.
 
     Args:
@@ -312,10 +385,9 @@ def append_rows(spreadsheet_id: str, range_notation: str, values: str) -> str:
     Returns:
         JSON with updated range and cells appended.
     """
-    client = get_client()
-    parsed_values = json.loads(values)
-    result = client.append_rows(spreadsheet_id, range_notation, parsed_values)
-    return json.dumps(result, indent=2)
+    parsed_values = _parse_rows(values)
+    result = await _run("append_rows", spreadsheet_id, range_notation, parsed_values)
+    return json.dumps(result)
 
 
 # =============================================================================
@@ -324,7 +396,7 @@ def append_rows(spreadsheet_id: str, range_notation: str, values: str) -> str:
 
 
 @mcp.tool()
-def insert_rows(
+async def insert_rows(
     spreadsheet_id: str, sheet_id: int, start_index: int, num_rows: int
 ) -> str:
     """Insert empty rows at a specific position.
@@ -338,15 +410,12 @@ def insert_rows(
     Returns:
         Success message.
     """
-    client = get_client()
-    client.insert_rows(spreadsheet_id, sheet_id, start_index, num_rows)
-    return json.dumps(
-        {"success": True, "message": f"Inserted {num_rows} rows at index {start_index}"}
-    )
+    await _run("insert_rows", spreadsheet_id, sheet_id, start_index, num_rows)
+    return _success(f"Inserted {num_rows} rows at index {start_index}")
 
 
 @mcp.tool()
-def insert_columns(
+async def insert_columns(
     spreadsheet_id: str, sheet_id: int, start_index: int, num_columns: int
 ) -> str:
     """Insert empty columns at a specific position.
@@ -360,18 +429,12 @@ def insert_columns(
     Returns:
         Success message.
     """
-    client = get_client()
-    client.insert_columns(spreadsheet_id, sheet_id, start_index, num_columns)
-    return json.dumps(
-        {
-            "success": True,
-            "message": f"Inserted {num_columns} columns at index {start_index}",
-        }
-    )
+    await _run("insert_columns", spreadsheet_id, sheet_id, start_index, num_columns)
+    return _success(f"Inserted {num_columns} columns at index {start_index}")
 
 
 @mcp.tool()
-def delete_rows(
+async def delete_rows(
     spreadsheet_id: str, sheet_id: int, start_index: int, num_rows: int
 ) -> str:
     """Delete rows from a sheet.
@@ -385,18 +448,12 @@ def delete_rows(
     Returns:
         Success message.
     """
-    client = get_client()
-    client.delete_rows(spreadsheet_id, sheet_id, start_index, num_rows)
-    return json.dumps(
-        {
-            "success": True,
-            "message": f"Deleted {num_rows} rows starting at index {start_index}",
-        }
-    )
+    await _run("delete_rows", spreadsheet_id, sheet_id, start_index, num_rows)
+    return _success(f"Deleted {num_rows} rows starting at index {start_index}")
 
 
 @mcp.tool()
-def delete_columns(
+async def delete_columns(
     spreadsheet_id: str, sheet_id: int, start_index: int, num_columns: int
 ) -> str:
     """Delete columns from a sheet.
@@ -410,14 +467,8 @@ def delete_columns(
     Returns:
         Success message.
     """
-    client = get_client()
-    client.delete_columns(spreadsheet_id, sheet_id, start_index, num_columns)
-    return json.dumps(
-        {
-            "success": True,
-            "message": f"Deleted {num_columns} columns starting at index {start_index}",
-        }
-    )
+    await _run("delete_columns", spreadsheet_id, sheet_id, start_index, num_columns)
+    return _success(f"Deleted {num_columns} columns starting at index {start_index}")
 
 
 # =============================================================================
@@ -426,7 +477,7 @@ def delete_columns(
 
 
 @mcp.tool()
-def format_cells(
+async def format_cells(
     spreadsheet_id: str,
     sheet_id: int,
     start_row: int,
@@ -468,21 +519,8 @@ def format_cells(
     Returns:
         Success message.
     """
-    client = get_client()
-
-    # Convert hex colors to RGB dicts
-    def hex_to_rgb(hex_color: str) -> dict | None:
-        if not hex_color:
-            return None
-        hex_color = hex_color.lstrip("#")
-        if len(hex_color) != 6:
-            return None
-        r = int(hex_color[0:2], 16) / 255
-        g = int(hex_color[2:4], 16) / 255
-        b = int(hex_color[4:6], 16) / 255
-        return {"red": r, "green": g, "blue": b}
-
-    client.format_cells(
+    await _run(
+        "format_cells",
         spreadsheet_id=spreadsheet_id,
         sheet_id=sheet_id,
         start_row=start_row,
@@ -492,15 +530,15 @@ def format_cells(
         bold=bold if bold else None,
         italic=italic if italic else None,
         font_size=font_size if font_size > 0 else None,
-        font_color=hex_to_rgb(font_color),
-        background_color=hex_to_rgb(background_color),
+        font_color=_hex_to_rgb(font_color),
+        background_color=_hex_to_rgb(background_color),
         horizontal_alignment=alignment if alignment else None,
     )
-    return json.dumps({"success": True, "message": "Formatting applied"})
+    return _success("Formatting applied")
 
 
 @mcp.tool()
-def set_column_width(
+async def set_column_width(
     spreadsheet_id: str, sheet_id: int, start_col: int, end_col: int, width: int
 ) -> str:
     """Set the width of columns.
@@ -515,13 +553,12 @@ def set_column_width(
     Returns:
         Success message.
     """
-    client = get_client()
-    client.set_column_width(spreadsheet_id, sheet_id, start_col, end_col, width)
-    return json.dumps({"success": True, "message": f"Column width set to {width}px"})
+    await _run("set_column_width", spreadsheet_id, sheet_id, start_col, end_col, width)
+    return _success(f"Column width set to {width}px")
 
 
 @mcp.tool()
-def merge_cells(
+async def merge_cells(
     spreadsheet_id: str,
     sheet_id: int,
     start_row: int,
@@ -544,11 +581,11 @@ def merge_cells(
     Returns:
         Success message.
     """
-    client = get_client()
-    client.merge_cells(
+    await _run(
+        "merge_cells",
         spreadsheet_id, sheet_id, start_row, end_row, start_col, end_col, merge_type
     )
-    return json.dumps({"success": True, "message": "Cells merged"})
+    return _success("Cells merged")
 
 
 # =============================================================================
@@ -557,7 +594,7 @@ def merge_cells(
 
 
 @mcp.tool()
-def create_chart(
+async def create_chart(
     spreadsheet_id: str,
     sheet_id: int,
     chart_type: str,
@@ -610,14 +647,12 @@ def create_chart(
     Returns:
         JSON with chart_id for later reference.
     """
-    client = get_client()
     
-    # Parse series_columns string to list
-    series_list = None
-    if series_columns.strip():
-        series_list = [int(x.strip()) for x in series_columns.split(",") if x.strip()]
+    # Parse series_columns string to a tuple of indices
+    series_list = tuple(map(int, _split_csv(series_columns))) or None
     
-    result = client.create_chart(
+    result = await _run(
+        "create_chart",
         spreadsheet_id=spreadsheet_id,
         sheet_id=sheet_id,
         chart_type=chart_type,
@@ -628,11 +663,11 @@ def create_chart(
         domain_column=domain_column,
         series_columns=series_list
     )
-    return json.dumps(result, indent=2)
+    return json.dumps(result)
 
 
 @mcp.tool()
-def list_charts(spreadsheet_id: str) -> str:
+async def list_charts(spreadsheet_id: str) -> str:
     """List all charts in a spreadsheet.
 
     Args:
@@ -641,13 +676,12 @@ def list_charts(spreadsheet_id: str) -> str:
     Returns:
         JSON list of charts with IDs, titles, and positions.
     """
-    client = get_client()
-    result = client.list_charts(spreadsheet_id)
-    return json.dumps(result, indent=2)
+    result = await _run("list_charts", spreadsheet_id)
+    return json.dumps(result)
 
 
 @mcp.tool()
-def delete_chart(spreadsheet_id: str, chart_id: int) -> str:
+async def delete_chart(spreadsheet_id: str, chart_id: int) -> str:
     """Delete a chart from the spreadsheet.
 
     Args:
@@ -657,9 +691,8 @@ def delete_chart(spreadsheet_id: str, chart_id: int) -> str:
     Returns:
         Success message.
     """
-    client = get_client()
-    client.delete_chart(spreadsheet_id, chart_id)
-    return json.dumps({"success": True, "message": f"Chart {chart_id} deleted"})
+    await _run("delete_chart", spreadsheet_id, chart_id)
+    return _success(f"Chart {chart_id} deleted")
 
 
 # =============================================================================
@@ -668,7 +701,7 @@ def delete_chart(spreadsheet_id: str, chart_id: int) -> str:
 
 
 @mcp.tool()
-def sort_range(
+async def sort_range(
     spreadsheet_id: str,
     sheet_id: int,
     start_row: int,
@@ -687,14 +720,15 @@ def sort_range(
         end_row: Ending row index (exclusive).
         start_col: Starting column index (0-based).
         end_col: Ending column index (exclusive).
-        sort_column: Column index to sort by (0-based, relative to range).
+        sort_column: Absolute column index to sort by (0-based, e.g. 2 for column C),
+            within start_col to end_col.
         ascending: True for A-Z/0-9, False for Z-A/9-0.
 
     Returns:
         Success message.
     """
-    client = get_client()
-    client.sort_range(
+    await _run(
+        "sort_range",
         spreadsheet_id,
         sheet_id,
         start_row,
@@ -705,13 +739,11 @@ def sort_range(
         ascending,
     )
     order = "ascending" if ascending else "descending"
-    return json.dumps(
-        {"success": True, "message": f"Range sorted by column {sort_column} ({order})"}
-    )
+    return _success(f"Range sorted by column {sort_column} ({order})")
 
 
 @mcp.tool()
-def find_replace(
+async def find_replace(
     spreadsheet_id: str,
     find: str,
     replace: str,
@@ -732,9 +764,9 @@ def find_replace(
     Returns:
         JSON with number of occurrences changed.
     """
-    client = get_client()
     sid = None if sheet_id < 0 else sheet_id
-    result = client.find_replace(
+    result = await _run(
+        "find_replace",
         spreadsheet_id,
         find,
         replace,
@@ -742,11 +774,50 @@ def find_replace(
         match_case=match_case,
         match_entire_cell=match_entire_cell,
     )
-    return json.dumps(result, indent=2)
+    return json.dumps(result)
+
+
+@mcp.tool()
+async def find_replace_many(
+    spreadsheet_id: str,
+    range_notation: str,
+    replacements: str,
+    match_case: bool = False,
+    match_entire_cell: bool = False,
+) -> str:
+    """Apply many find/replace pairs to a range in a single read and write.
+
+    Prefer this over repeated find_replace calls when there are several
+    pairs. Only text cells are changed; numbers and formulas are left alone.
+
+    Args:
+        spreadsheet_id: The ID of the spreadsheet.
+        range_notation: A1 notation range to search (e.g., "Sheet1!A1:D100").
+        replacements: JSON object mapping find text to replacement text.
+        match_case: Case-sensitive matching.
+        match_entire_cell: Only match if cell equals find text exactly.
+
+    Returns:
+        JSON with number of occurrences changed.
+    """
+    pairs = json.loads(replacements)
+    if not isinstance(pairs, dict) or not all(
+        isinstance(value, str) for value in pairs.values()
+    ):
+        raise ValueError("replacements must be a JSON object of strings")
+    result = await _run(
+        "find_replace_many",
+        spreadsheet_id,
+        range_notation,
+        list(pairs.items()),
+        match_case=match_case,
+        match_entire_cell=match_entire_cell,
+    )
+    return json.dumps(result)
 
 
 @mcp.tool()
-def get_last_row(spreadsheet_id: str, sheet_name: str, column: str = "A") -> str:
+async def get_last_row(spreadsheet_id: str, sheet_name: str, column: str = "A") -> str:
     """Find the last row with data in a column.
 
     Args:
@@ -757,8 +828,7 @@ def get_last_row(spreadsheet_id: str, sheet_name: str, column: str = "A") -> str
     Returns:
         JSON with the last row number (1-based).
     """
-    client = get_client()
-    last_row = client.get_last_row(spreadsheet_id, sheet_name, column)
+    last_row = await _run("get_last_row", spreadsheet_id, sheet_name, column)
     return json.dumps({"last_row": last_row, "sheet": sheet_name, "column": column})
 
 
@@ -768,7 +838,7 @@ def get_last_row(spreadsheet_id: str, sheet_name: str, column: str = "A") -> str
 
 
 @mcp.tool()
-def share_spreadsheet(
+async def share_spreadsheet(
     spreadsheet_id: str,
     email: str = "",
     role: str = "reader",
@@ -785,14 +855,14 @@ def share_spreadsheet(
     Returns:
         JSON with sharing result.
     """
-    client = get_client()
-    result = client.share_spreadsheet(
+    result = await _run(
+        "share_spreadsheet",
         spreadsheet_id=spreadsheet_id,
         email=email if email else None,
         role=role,
         make_public=make_public,
     )
-    return json.dumps(result, indent=2)
+    return json.dumps(result)
 
 
 # =============================================================================
@@ -800,8 +870,19 @@ def share_spreadsheet(
 # =============================================================================
 
 
+def _install_uvloop() -> None:
+    """Use uvloop for the server's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def main():
     """Run the MCP server."""
+    _install_uvloop()
+    start_warmup()
     mcp.run()
 
 
@@ -1,9 +1,362 @@
 """Google Sheets API Client Wrapper."""
 
-from typing import Any
+import functools
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, NotRequired, TypedDict
 from googleapiclient.discovery import Resource
+from googleapiclient.http import HttpRequest
+
+from .auth import (
+    REQUEST_BURST,
+    get_sheets_service,
+    get_drive_service,
+    rate_limiter_for,
+)
+
+# Seconds that spreadsheet metadata (sheet IDs, titles, sizes) is served
+# from cache before get_spreadsheet_info hits the API again.
+METADATA_TTL = 10.0
+
+# Retries for rate-limit (429/403 rateLimitExceeded), 5xx and connection
+# errors, using googleapiclient's exponential backoff with jitter. Calls that
+# are not safe to repeat (creating a spreadsheet, appending rows, sharing, which
+# can email the recipient again) run once, as do batchUpdates with any request
+# type outside _RETRYABLE_OPS.
+API_RETRIES = 5
+
+# batch_read ranges travel in the batchGet query string, so long range lists
+# are split into chunks of this size and fetched on a few threads at once.
+BATCH_GET_CHUNK_SIZE = 100
+BATCH_GET_WORKERS = 8
+
+# One pool for every batch_read, kept for the life of the process: its threads
+# keep their per-thread transports (and open connections) between calls, and
+# however many tools run at once, at most BATCH_GET_WORKERS chunks are in flight
+_batch_get_pool = ThreadPoolExecutor(
+    max_workers=BATCH_GET_WORKERS, thread_name_prefix="batch-get"
+)
+
+# Most calls one multipart request can carry (the per-batch limit for Google
+# APIs). Every call still counts against the quota, so while throttling is on
+# batch_execute sends at most REQUEST_BURST calls per request.
+BATCH_HTTP_LIMIT = 100
+BATCH_EXECUTE_CHUNK = min(BATCH_HTTP_LIMIT, REQUEST_BURST or BATCH_HTTP_LIMIT)
+
+# Rows fetched per values.get call by iter_cells
+ITER_PAGE_ROWS = 1000
+
+# The cell span of an A1 range with a colon, e.g. "A1:D100", "A:D", "3:50"
+_A1_SPAN = re.compile(r"([A-Za-z]*)(\d*):([A-Za-z]*)(\d*)")
+
+# Partial-response mask: only what get_spreadsheet_info reports, instead of
+# the full spreadsheet resource
+SPREADSHEET_INFO_FIELDS = (
+    "spreadsheetId,spreadsheetUrl,properties(title,locale),"
+    "sheets.properties(sheetId,title,index,gridProperties(rowCount,columnCount))"
+)
+LIST_CHARTS_FIELDS = "sheets(properties.title,charts(chartId,spec.title,position))"
+
+# format_cells field paths, in the bit order it uses: bold=1, italic=2,
+# font_size=4, font_color=8, background_color=16, horizontal_alignment=32
+_FORMAT_FIELD_PATHS = (
+    "userEnteredFormat.textFormat.bold",
+    "userEnteredFormat.textFormat.italic",
+    "userEnteredFormat.textFormat.fontSize",
+    "userEnteredFormat.textFormat.foregroundColor",
+    "userEnteredFormat.backgroundColor",
+    "userEnteredFormat.horizontalAlignment",
+)
+# Every possible "fields" mask, indexed by the bits of the fields being set
+_FORMAT_FIELD_MASKS = tuple(
+    ",".join(path for i, path in enumerate(_FORMAT_FIELD_PATHS) if bits >> i & 1)
+    for bits in range(1 << len(_FORMAT_FIELD_PATHS))
+)
+
+
+class BatchWriteItem(TypedDict):
+    """One range and its rows in a batch_write payload."""
+
+    range: str
+    values: list[list[Any]]
+    # "ROWS" (the API default) or "COLUMNS"
+    majorDimension: NotRequired[str]
+
+
+def _check_span(axis: str, start: int, end: int) -> None:
+    """Reject a 0-based, end-exclusive span the API would refuse anyway."""
+    if start < 0 or end <= start:
+        raise ValueError(
+            f"Invalid {axis} range {start}-{end}: indexes are 0-based with the "
+            "end exclusive, so need 0 <= start < end"
+        )
+
+
+def _grid_range(
+    sheet_id: int, start_row: int, end_row: int, start_col: int, end_col: int
+) -> dict:
+    """GridRange for 0-based, end-exclusive row and column indexes."""
+    _check_span("row", start_row, end_row)
+    _check_span("column", start_col, end_col)
+    return {
+        "sheetId": sheet_id,
+        "startRowIndex": start_row,
+        "endRowIndex": end_row,
+        "startColumnIndex": start_col,
+        "endColumnIndex": end_col,
+    }
+
+
+def _dimension_range(
+    sheet_id: int, dimension: str, start_index: int, end_index: int
+) -> dict:
+    """DimensionRange of rows or columns, 0-based and end-exclusive."""
+    _check_span("row" if dimension == "ROWS" else "column", start_index, end_index)
+    return {
+        "sheetId": sheet_id,
+        "dimension": dimension,
+        "startIndex": start_index,
+        "endIndex": end_index,
+    }
+
+
+def _column_source(sheet_id: int, start_row: int, end_row: int, col: int) -> dict:
+    """Chart source range covering one column of the data rows."""
+    return {
+        "sourceRange": {
+            "sources": [_grid_range(sheet_id, start_row, end_row, col, col + 1)]
+        }
+    }
+
+
+def _basic_chart_spec(
+    chart_type: str,
+    title: str,
+    sheet_id: int,
+    start_row: int,
+    end_row: int,
+    domain_col: int,
+    series_cols: list[int],
+) -> dict:
+    """Spec for BAR, COLUMN, LINE, AREA and SCATTER charts (one series per column)."""
+    return {
+        "title": title,
+        "basicChart": {
+            "chartType": chart_type,
+            "legendPosition": "BOTTOM_LEGEND",
+            "domains": [
+                {"domain": _column_source(sheet_id, start_row, end_row, domain_col)}
+            ],
+            "series": [
+                {
+                    "series": _column_source(sheet_id, start_row, end_row, col),
+                    "targetAxis": "LEFT_AXIS",
+                }
+                for col in series_cols
+            ],
+            "headerCount": 1,
+        },
+    }
+
+
+def _pie_chart_spec(
+    chart_type: str,
+    title: str,
+    sheet_id: int,
+    start_row: int,
+    end_row: int,
+    domain_col: int,
+    series_cols: list[int],
+) -> dict:
+    """Spec for PIE charts, which take a single series (the first one)."""
+    series_col = series_cols[0] if series_cols else domain_col + 1
+    return {
+        "title": title,
+        "pieChart": {
+            "legendPosition": "RIGHT_LEGEND",
+            "domain": _column_source(sheet_id, start_row, end_row, domain_col),
+            "series": _column_source(sheet_id, start_row, end_row, series_col),
+        },
+    }
+
+
+# Chart types whose spec is not a basicChart; everything else uses
+# _basic_chart_spec
+_CHART_SPEC_BUILDERS: dict[str, Callable[..., dict]] = {
+    "PIE": _pie_chart_spec,
+}
+
+
+def _union_adjacent(a: dict, b: dict) -> dict | None:
+    """Union of two GridRanges that share a side, or None if they don't."""
+    if a["sheetId"] != b["sheetId"]:
+        return None
+    for start, end, other_start, other_end in (
+        ("startColumnIndex", "endColumnIndex", "startRowIndex", "endRowIndex"),
+        ("startRowIndex", "endRowIndex", "startColumnIndex", "endColumnIndex"),
+    ):
+        # Same span on one axis, touching on the other
+        if a[other_start] == b[other_start] and a[other_end] == b[other_end]:
+            if a[end] == b[start] or b[end] == a[start]:
+                return {**a, start: min(a[start], b[start]), end: max(a[end], b[end])}
+    return None
+
+
+# The parts of each batchUpdate reply that callers read; every other reply
+# (and the rest of these, e.g. an added chart's full spec) is masked out
+_REPLY_FIELDS = {
+    "addSheet": "addSheet.properties(sheetId,title,index,gridProperties)",
+    "duplicateSheet": "duplicateSheet.properties(sheetId,title,index,gridProperties)",
+    "addChart": "addChart.chart(chartId,position)",
+    "findReplace": "findReplace",
+}
+
+
+# batchUpdate request types that leave the sheet the same when applied twice.
+# A retried request may already have reached the server, so inserting or
+# deleting rows, adding charts or sheets, sorting and find/replace are sent once.
+_RETRYABLE_OPS = frozenset(
+    {"updateSheetProperties", "repeatCell", "updateDimensionProperties", "mergeCells"}
+)
+
+
+def _batch_retries(requests: list[dict]) -> int:
+    """Retries for a batchUpdate: API_RETRIES only if every request is retryable."""
+    if all(op in _RETRYABLE_OPS for request in requests for op in request):
+        return API_RETRIES
+    return 0
+
+
+def _reply_fields(requests: list[dict]) -> str:
+    """batchUpdate response mask for the replies these requests need."""
+    masks = sorted(
+        {
+            _REPLY_FIELDS[op]
+            for request in requests
+            for op in request
+            if op in _REPLY_FIELDS
+        }
+    )
+    return f"replies({','.join(masks)})" if masks else "spreadsheetId"
+
+
+# Write-through patches for cached metadata. Each takes a copy of the cached
+# sheets list, the request payload and its reply, and edits the list to match
+# what the request did. A KeyError means the cache can't be patched (e.g. the
+# sheet isn't in it), and the entry is dropped instead.
+_MetadataPatch = Callable[[list[dict], dict, dict], None]
+
+
+def _cached_sheet(sheets: list[dict], sheet_id: int) -> dict:
+    """The cached entry for a sheet ID, or KeyError."""
+    for sheet in sheets:
+        if sheet["sheet_id"] == sheet_id:
+            return sheet
+    raise KeyError(sheet_id)
+
+
+def _patch_added_sheet(sheets: list[dict], payload: dict, reply: dict) -> None:
+    """addSheet / duplicateSheet: insert the new sheet from the reply."""
+    props = next(iter(reply.values()))["properties"]
+    grid = props.get("gridProperties", {})
+    for sheet in sheets:
+        if sheet["index"] >= props["index"]:
+            sheet["index"] += 1
+    sheets.append(
+        {
+            "sheet_id": props["sheetId"],
+            "title": props["title"],
+            "index": props["index"],
+            "row_count": grid.get("rowCount", 0),
+            "column_count": grid.get("columnCount", 0),
+        }
+    )
+    sheets.sort(key=lambda sheet: sheet["index"])
+
+
+def _patch_deleted_sheet(sheets: list[dict], payload: dict, reply: dict) -> None:
+    """deleteSheet: drop the sheet and close the gap in the indexes."""
+    gone = _cached_sheet(sheets, payload["sheetId"])
+    sheets.remove(gone)
+    for sheet in sheets:
+        if sheet["index"] > gone["index"]:
+            sheet["index"] -= 1
+
+
+def _patch_renamed_sheet(sheets: list[dict], payload: dict, reply: dict) -> None:
+    """updateSheetProperties with fields="title": take the new title."""
+    props = payload["properties"]
+    _cached_sheet(sheets, props["sheetId"])["title"] = props["title"]
+
+
+def _dimension_patch(sign: int) -> _MetadataPatch:
+    """insertDimension (+1) / deleteDimension (-1): resize the grid."""
+
+    def patch(sheets: list[dict], payload: dict, reply: dict) -> None:
+        span = payload["range"]
+        key = "row_count" if span["dimension"] == "ROWS" else "column_count"
+        count = span["endIndex"] - span["startIndex"]
+        _cached_sheet(sheets, span["sheetId"])[key] += sign * count
+
+    return patch
+
+
+_patch_inserted_dimension = _dimension_patch(1)
+_patch_deleted_dimension = _dimension_patch(-1)
+
 
-from .auth import get_sheets_service, get_drive_service
+class _PendingBatch:
+    """batchUpdate requests queued by SheetsClient.batch(), one future per call."""
+
+    def __init__(self, spreadsheet_id: str):
+        self.spreadsheet_id = spreadsheet_id
+        self.requests: list[dict] = []
+        # (future, parse, index of the request whose reply resolves it)
+        self.handlers: list[tuple[Future, Callable[[dict], Any] | None, int]] = []
+        # (patch, payload, index of its request), in request order
+        self.metadata_patches: list[tuple[_MetadataPatch, dict, int]] = []
+
+    def add(
+        self,
+        request: dict,
+        parse: Callable[[dict], Any] | None,
+        metadata_patch: _MetadataPatch | None,
+    ) -> Future:
+        """Queue a request and return the future for its parsed reply."""
+        if not self._merge_repeat_cell(request):
+            self.requests.append(request)
+        index = len(self.requests) - 1
+        future: Future = Future()
+        self.handlers.append((future, parse, index))
+        if metadata_patch is not None:
+            payload = next(iter(request.values()))
+            self.metadata_patches.append((metadata_patch, payload, index))
+        return future
+
+    def _merge_repeat_cell(self, request: dict) -> bool:
+        """Fold a repeatCell into the previous one if it extends it seamlessly.
+
+        Only the last queued request is considered, so nothing is reordered
+        around the requests in between.
+        """
+        new = request.get("repeatCell")
+        if new is None or not self.requests:
+            return False
+        last = self.requests[-1].get("repeatCell")
+        if last is None or last["fields"] != new["fields"]:
+            return False
+        if last["cell"] != new["cell"]:
+            return False
+        merged = _union_adjacent(last["range"], new["range"])
+        if merged is None:
+            return False
+        last["range"] = merged
+        return True
 
 
 class SheetsClient:
@@ -11,6 +364,13 @@ class SheetsClient:
 
     def __init__(self):
         self._service: Resource | None = None
+        self._drive: Resource | None = None
+        # spreadsheet_id -> (fetched_at, get_spreadsheet_info result)
+        self._info_cache: dict[str, tuple[float, dict]] = {}
+        # spreadsheet_id -> (sheets list it was built from, {title: sheet_id})
+        self._sheet_ids: dict[str, tuple[list[dict], dict[str, int]]] = {}
+        # Per-thread, so concurrent tool calls never join each other's batch
+        self._local = threading.local()
 
     @property
     def service(self) -> Resource:
@@ -20,14 +380,247 @@ class SheetsClient:
         return self._service
 
     @property
-    def spreadsheets(self):
+    def drive(self) -> Resource:
+        """Lazy-load the Drive API service."""
+        if self._drive is None:
+            self._drive = get_drive_service()
+        return self._drive
+
+    def _cache_metadata(self, result: dict) -> dict:
+        """Summarize a Spreadsheet resource and cache it as get_spreadsheet_info."""
+        sheets_info = []
+        for sheet in result.get("sheets", []):
+            props = sheet["properties"]
+            sheets_info.append(
+                {
+                    "sheet_id": props["sheetId"],
+                    "title": props["title"],
+                    "index": props["index"],
+                    "row_count": props.get("gridProperties", {}).get("rowCount", 0),
+                    "column_count": props.get("gridProperties", {}).get(
+                        "columnCount", 0
+                    ),
+                }
+            )
+
+        info = {
+            "spreadsheet_id": result["spreadsheetId"],
+            "title": result["properties"]["title"],
+            "url": result["spreadsheetUrl"],
+            "locale": result["properties"].get("locale", ""),
+            "sheets": sheets_info,
+        }
+        self._info_cache[info["spreadsheet_id"]] = (time.monotonic(), info)
+        return info
+
+    def _invalidate_metadata(self, spreadsheet_id: str) -> None:
+        """Drop cached metadata after a call that changes sheets or their size."""
+        self._info_cache.pop(spreadsheet_id, None)
+
+    def _patch_metadata(
+        self, spreadsheet_id: str, patches: list[tuple[_MetadataPatch, dict, dict]]
+    ) -> None:
+        """Apply (patch, payload, reply) edits to the cached metadata, if any.
+
+        The patched info replaces the entry rather than being edited in place,
+        since earlier get_spreadsheet_info/list_sheets results share it. Its
+        fetch time is kept, so the TTL still bounds staleness from other
+        editors.
+        """
+        cached = self._info_cache.get(spreadsheet_id)
+        if cached is None:
+            return
+        fetched_at, info = cached
+        sheets = [dict(sheet) for sheet in info["sheets"]]
+        try:
+            for patch, payload, reply in patches:
+                patch(sheets, payload, reply)
+        except KeyError:
+            self._invalidate_metadata(spreadsheet_id)
+            return
+        self._info_cache[spreadsheet_id] = (fetched_at, {**info, "sheets": sheets})
+
+    # Building a Resource re-walks the discovery document (tens of ms), so
+    # each one is made once per client. Resources hold no per-request state;
+    # every call still goes out on the calling thread's own transport.
+
+    @functools.cached_property
+    def spreadsheets(self) -> Resource:
         """Access the spreadsheets resource."""
         return self.service.spreadsheets()
 
-    @property
-    def values(self):
+    @functools.cached_property
+    def values(self) -> Resource:
         """Access the spreadsheets.values resource."""
-        return self.service.spreadsheets().values()
+        return self.spreadsheets.values()
+
+    @functools.cached_property
+    def permissions(self) -> Resource:
+        """Access the Drive permissions resource."""
+        return self.drive.permissions()
+
+    # =========================================================================
+    # Batching
+    # =========================================================================
+
+    @contextmanager
+    def batch(self, spreadsheet_id: str) -> Iterator[None]:
+        """Send the edits made inside the block as one batchUpdate call.
+
+        Inside the block, methods that would issue a spreadsheets.batchUpdate
+        for ``spreadsheet_id`` queue their request instead and return a
+        ``concurrent.futures.Future``. On exit the queued requests are sent
+        in order in a single call, and each future resolves to what the
+        method would have returned. If the block raises, nothing is sent and
+        the futures are cancelled.
+
+        Back-to-back format_cells calls that apply the same format to
+        ranges sharing an edge are sent as one repeatCell over their union.
+
+        Example:
+            with client.batch(spreadsheet_id):
+                client.format_cells(spreadsheet_id, 0, 0, 1, 0, 5, bold=True)
+                chart = client.create_chart(spreadsheet_id, 0, "LINE", "A1:C10")
+            chart_id = chart.result()["chart_id"]
+        """
+        if getattr(self._local, "batch", None) is not None:
+            raise RuntimeError("SheetsClient.batch() blocks cannot be nested")
+
+        pending = _PendingBatch(spreadsheet_id)
+        self._local.batch = pending
+        try:
+            yield
+        except BaseException:
+            for future, _, _ in pending.handlers:
+                future.cancel()
+            raise
+        finally:
+            self._local.batch = None
+
+        self._send_batch(pending)
+
+    def _run_op(
+        self,
+        spreadsheet_id: str,
+        op_name: str,
+        payload: dict,
+        parse: Callable[[dict], Any] | None = None,
+        metadata_patch: _MetadataPatch | None = None,
+    ) -> Any:
+        """Run a single batchUpdate request, or queue it inside batch().
+
+        This is the one path every structural and formatting edit takes.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet.
+            op_name: The request type, e.g. "deleteSheet" or "repeatCell".
+            payload: The body for that request type.
+            parse: Turns the request's reply into the caller's return value.
+                Without it the result is True.
+            metadata_patch: For requests that add, remove, rename or resize
+                sheets, the edit that brings cached metadata up to date.
+
+        Returns:
+            The parsed reply, or a Future for it when queued.
+        """
+        request = {op_name: payload}
+        pending = getattr(self._local, "batch", None)
+        if pending is not None and pending.spreadsheet_id == spreadsheet_id:
+            return pending.add(request, parse, metadata_patch)
+
+        result = self.spreadsheets.batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={"requests": [request]},
+            fields=_reply_fields([request]),
+        ).execute(num_retries=_batch_retries([request]))
+        # Masked down to spreadsheetId, the response has no replies at all
+        reply = result.get("replies", [{}])[0]
+        if metadata_patch is not None:
+            self._patch_metadata(spreadsheet_id, [(metadata_patch, payload, reply)])
+
+        return parse(reply) if parse else True
+
+    def _nothing_to_send(self, spreadsheet_id: str) -> Any:
+        """True for an op with nothing to send, or a resolved Future in batch()."""
+        pending = getattr(self._local, "batch", None)
+        if pending is None or pending.spreadsheet_id != spreadsheet_id:
+            return True
+        future: Future = Future()
+        future.set_result(True)
+        return future
+
+    def _send_batch(self, pending: _PendingBatch) -> None:
+        """Send queued requests in one call and resolve their futures."""
+        if not pending.requests:
+            return
+
+        try:
+            result = self.spreadsheets.batchUpdate(
+                spreadsheetId=pending.spreadsheet_id,
+                body={"requests": pending.requests},
+                fields=_reply_fields(pending.requests),
+            ).execute(num_retries=_batch_retries(pending.requests))
+        except Exception as e:
+            for future, _, _ in pending.handlers:
+                future.set_exception(e)
+            raise
+
+        replies = result.get("replies") or [{}] * len(pending.requests)
+        if pending.metadata_patches:
+            self._patch_metadata(
+                pending.spreadsheet_id,
+                [
+                    (patch, payload, replies[index])
+                    for patch, payload, index in pending.metadata_patches
+                ],
+            )
+
+        for future, parse, index in pending.handlers:
+            future.set_result(parse(replies[index]) if parse else True)
+
+    def batch_execute(self, calls: Sequence[HttpRequest]) -> list[Any]:
+        """Send independent Sheets API calls together as multipart batches.
+
+        Unlike batch(), which folds edits of one spreadsheet into a single
+        batchUpdate, this bundles arbitrary calls (reads, writes, calls on
+        different spreadsheets) built from ``spreadsheets`` or ``values``
+        without executing them, up to BATCH_EXECUTE_CHUNK per HTTP round trip.
+        The calls are not retried, and their bodies are never gzipped.
+
+        Each call still counts against the read or write quota, so a chunk
+        waits for one token per call it carries before it is sent. Once the
+        bucket is empty, that is about REQUEST_BURST / REQUESTS_PER_SECOND
+        seconds per full chunk (12 s with the defaults), so large call lists
+        take minutes rather than going over the per-minute quota.
+
+        Example:
+            info, values = client.batch_execute([
+                client.spreadsheets.get(spreadsheetId=sid, fields="properties"),
+                client.values.get(spreadsheetId=sid, range="Sheet1!A1:B2"),
+            ])
+
+        Args:
+            calls: Unexecuted requests, e.g. ``client.values.get(...)``.
+
+        Returns:
+            Each call's response in call order, or the exception it failed
+            with.
+        """
+        results: list[Any] = [None] * len(calls)
+
+        def collect(request_id: str, response: Any, error: Exception | None) -> None:
+            results[int(request_id)] = response if error is None else error
+
+        for start in range(0, len(calls), BATCH_EXECUTE_CHUNK):
+            chunk = calls[start : start + BATCH_EXECUTE_CHUNK]
+            batch = self.service.new_batch_http_request(callback=collect)
+            for offset, call in enumerate(chunk):
+                batch.add(call, request_id=str(start + offset))
+            # Each call in the batch counts against the quota on its own
+            for method, count in Counter(call.method for call in chunk).items():
+                rate_limiter_for(method).acquire(count)
+            batch.execute()
+        return results
 
     # =========================================================================
     # Spreadsheet Management
@@ -51,6 +644,9 @@ class SheetsClient:
             body["sheets"] = [{"properties": {"title": name}} for name in sheet_names]
 
         result = self.spreadsheets.create(body=body).execute()
+        # The reply is the full spreadsheet resource, so a follow-up
+        # get_spreadsheet_info/list_sheets can be answered without a request
+        self._cache_metadata(result)
         return {
             "spreadsheet_id": result["spreadsheetId"],
             "title": result["properties"]["title"],
@@ -67,29 +663,14 @@ class SheetsClient:
         Returns:
             Spreadsheet metadata including title, sheets, and URL.
         """
-        result = self.spreadsheets.get(spreadsheetId=spreadsheet_id).execute()
-        sheets_info = []
-        for sheet in result.get("sheets", []):
-            props = sheet["properties"]
-            sheets_info.append(
-                {
-                    "sheet_id": props["sheetId"],
-                    "title": props["title"],
-                    "index": props["index"],
-                    "row_count": props.get("gridProperties", {}).get("rowCount", 0),
-                    "column_count": props.get("gridProperties", {}).get(
-                        "columnCount", 0
-                    ),
-                }
-            )
+        cached = self._info_cache.get(spreadsheet_id)
+        if cached is not None and time.monotonic() - cached[0] < METADATA_TTL:
+            return cached[1]
 
-        return {
-            "spreadsheet_id": result["spreadsheetId"],
-            "title": result["properties"]["title"],
-            "url": result["spreadsheetUrl"],
-            "locale": result["properties"].get("locale", ""),
-            "sheets": sheets_info,
-        }
+        result = self.spreadsheets.get(
+            spreadsheetId=spreadsheet_id, fields=SPREADSHEET_INFO_FIELDS
+        ).execute(num_retries=API_RETRIES)
+        return self._cache_metadata(result)
 
     # =========================================================================
     # Sheet Management
@@ -124,18 +705,21 @@ class SheetsClient:
         if index is not None:
             properties["index"] = index
 
-        request = {"requests": [{"addSheet": {"properties": properties}}]}
-
-        result = self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
+        def new_sheet_info(reply: dict) -> dict:
+            new_sheet = reply["addSheet"]["properties"]
+            return {
+                "sheet_id": new_sheet["sheetId"],
+                "title": new_sheet["title"],
+                "index": new_sheet["index"],
+            }
 
-        new_sheet = result["replies"][0]["addSheet"]["properties"]
-        return {
-            "sheet_id": new_sheet["sheetId"],
-            "title": new_sheet["title"],
-            "index": new_sheet["index"],
-        }
+        return self._run_op(
+            spreadsheet_id,
+            "addSheet",
+            {"properties": properties},
+            new_sheet_info,
+            metadata_patch=_patch_added_sheet,
+        )
 
     def delete_sheet(self, spreadsheet_id: str, sheet_id: int) -> bool:
         """Delete a sheet from a spreadsheet.
@@ -147,12 +731,12 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {"requests": [{"deleteSheet": {"sheetId": sheet_id}}]}
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "deleteSheet",
+            {"sheetId": sheet_id},
+            metadata_patch=_patch_deleted_sheet,
+        )
 
     def rename_sheet(self, spreadsheet_id: str, sheet_id: int, new_title: str) -> bool:
         """Rename a sheet.
@@ -165,21 +749,15 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "updateSheetProperties": {
-                        "properties": {"sheetId": sheet_id, "title": new_title},
-                        "fields": "title",
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "updateSheetProperties",
+            {
+                "properties": {"sheetId": sheet_id, "title": new_title},
+                "fields": "title",
+            },
+            metadata_patch=_patch_renamed_sheet,
+        )
 
     def duplicate_sheet(
         self,
@@ -206,18 +784,21 @@ class SheetsClient:
         if insert_index is not None:
             request_body["insertSheetIndex"] = insert_index
 
-        request = {"requests": [{"duplicateSheet": request_body}]}
-
-        result = self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
+        def new_sheet_info(reply: dict) -> dict:
+            new_sheet = reply["duplicateSheet"]["properties"]
+            return {
+                "sheet_id": new_sheet["sheetId"],
+                "title": new_sheet["title"],
+                "index": new_sheet["index"],
+            }
 
-        new_sheet = result["replies"][0]["duplicateSheet"]["properties"]
-        return {
-            "sheet_id": new_sheet["sheetId"],
-            "title": new_sheet["title"],
-            "index": new_sheet["index"],
-        }
+        return self._run_op(
+            spreadsheet_id,
+            "duplicateSheet",
+            request_body,
+            new_sheet_info,
+            metadata_patch=_patch_added_sheet,
+        )
 
     def _get_sheet_id_by_name(self, spreadsheet_id: str, sheet_name: str) -> int:
         """Get sheet ID from sheet name.
@@ -229,22 +810,40 @@ class SheetsClient:
         Returns:
             The numeric sheet ID.
         """
+        try:
+            return self._get_sheet_id_map(spreadsheet_id)[sheet_name]
+        except KeyError:
+            raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet") from None
+
+    def _get_sheet_id_map(self, spreadsheet_id: str) -> dict[str, int]:
+        """Map sheet titles to sheet IDs, rebuilt only when the metadata is."""
         sheets = self.list_sheets(spreadsheet_id)
-        for sheet in sheets:
-            if sheet["title"] == sheet_name:
-                return sheet["sheet_id"]
-        raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet")
+        cached = self._sheet_ids.get(spreadsheet_id)
+        # list_sheets hands back the cached list itself, so identity tells us
+        # whether the map still matches the current metadata cache entry
+        if cached is None or cached[0] is not sheets:
+            cached = (sheets, {sheet["title"]: sheet["sheet_id"] for sheet in sheets})
+            self._sheet_ids[spreadsheet_id] = cached
+        return cached[1]
 
     # =========================================================================
     # Cell Operations
     # =========================================================================
 
-    def read_cells(self, spreadsheet_id: str, range_notation: str) -> list[list]:
+    def read_cells(
+        self,
+        spreadsheet_id: str,
+        range_notation: str,
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> list[list]:
         """Read values from a range.
 
         Args:
             spreadsheet_id: The ID of the spreadsheet.
             range_notation: A1 notation range (e.g., "Sheet1!A1:D10").
+            value_render_option: FORMATTED_VALUE (display strings),
+                UNFORMATTED_VALUE (numbers as JSON numbers, dates as serial
+                numbers) or FORMULA.
 
         Returns:
             2D list of cell values.
@@ -252,16 +851,82 @@ class SheetsClient:
         result = self.values.get(
             spreadsheetId=spreadsheet_id,
             range=range_notation,
-            valueRenderOption="FORMATTED_VALUE",
-        ).execute()
+            valueRenderOption=value_render_option,
+        ).execute(num_retries=API_RETRIES)
         return result.get("values", [])
 
+    def iter_cells(
+        self,
+        spreadsheet_id: str,
+        range_notation: str,
+        page_rows: int = ITER_PAGE_ROWS,
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> Iterator[list]:
+        """Yield the rows of a range, fetching it page_rows rows at a time.
+
+        Produces the same rows as read_cells, but only one window of the range
+        is in memory at once and the first rows arrive before the rest of the
+        range is downloaded. A range without an end row (e.g. "Sheet1!A:D")
+        runs to the last row of the sheet's grid. For bulk scans,
+        UNFORMATTED_VALUE keeps numbers as JSON numbers, which are smaller
+        to download and parse than their formatted strings.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet.
+            range_notation: A1 notation range (e.g., "Sheet1!A1:D50000").
+            page_rows: Number of rows requested per call.
+            value_render_option: How values are rendered, as in read_cells.
+
+        Yields:
+            Lists of cell values, one per row.
+        """
+        sheet, bang, span = range_notation.rpartition("!")
+        match = _A1_SPAN.fullmatch(span)
+        if not match:
+            # A single cell or named range; nothing to page
+            yield from self.read_cells(
+                spreadsheet_id, range_notation, value_render_option
+            )
+            return
+
+        start_col, start_row, end_col, end_row = match.groups()
+        first = int(start_row) if start_row else 1
+        last = int(end_row) if end_row else self._grid_row_count(spreadsheet_id, sheet)
+
+        # Blank rows inside a window are returned as [], but trailing ones are
+        # dropped; hold those back until a later window shows more data
+        blank_rows = 0
+        for top in range(first, last + 1, page_rows):
+            bottom = min(top + page_rows - 1, last)
+            window = f"{sheet}{bang}{start_col}{top}:{end_col}{bottom}"
+            rows = self.read_cells(spreadsheet_id, window, value_render_option)
+            if rows:
+                for _ in range(blank_rows):
+                    yield []
+                yield from rows
+                blank_rows = 0
+            blank_rows += bottom - top + 1 - len(rows)
+
+    def _grid_row_count(self, spreadsheet_id: str, sheet: str) -> int:
+        """Row count of a sheet's grid, by A1 sheet prefix ("" = first sheet)."""
+        sheets = self.list_sheets(spreadsheet_id)
+        if not sheet:
+            return sheets[0]["row_count"]
+
+        title = sheet[1:-1].replace("''", "'") if sheet.startswith("'") else sheet
+        for info in sheets:
+            if info["title"] == title:
+                return info["row_count"]
+        raise ValueError(f"Sheet '{title}' not found in spreadsheet")
+
     def write_cells(
         self,
         spreadsheet_id: str,
         range_notation: str,
         values: list[list],
         value_input_option: str = "USER_ENTERED",
+        include_values_in_response: bool = False,
+        response_value_render_option: str = "FORMATTED_VALUE",
     ) -> dict:
         """Write values to a range.
 
@@ -270,41 +935,87 @@ class SheetsClient:
             range_notation: A1 notation range (e.g., "Sheet1!A1").
             values: 2D list of values to write. Use formulas like "=SUM(A1:A10)".
             value_input_option: How to interpret input (USER_ENTERED or RAW).
+            include_values_in_response: Also return the written cells as the
+                sheet now shows them (e.g. computed formula results), saving
+                a read_cells call.
+            response_value_render_option: How those values are rendered, as
+                in read_cells.
 
         Returns:
-            Update result with number of updated cells.
+            Update result with number of updated cells, plus "updated_values"
+            when include_values_in_response is set.
         """
+        params: dict[str, Any] = {}
+        if include_values_in_response:
+            params = {
+                "includeValuesInResponse": True,
+                "responseValueRenderOption": response_value_render_option,
+            }
         result = self.values.update(
             spreadsheetId=spreadsheet_id,
             range=range_notation,
             valueInputOption=value_input_option,
             body={"values": values},
-        ).execute()
+            **params,
+        ).execute(num_retries=API_RETRIES)
 
-        return {
+        output = {
             "updated_range": result.get("updatedRange", ""),
             "updated_rows": result.get("updatedRows", 0),
             "updated_columns": result.get("updatedColumns", 0),
             "updated_cells": result.get("updatedCells", 0),
         }
+        if include_values_in_response:
+            output["updated_values"] = result.get("updatedData", {}).get("values", [])
+        return output
 
     def batch_read(
-        self, spreadsheet_id: str, ranges: list[str]
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        value_render_option: str = "FORMATTED_VALUE",
     ) -> dict[str, list[list]]:
         """Read values from multiple ranges.
 
         Args:
             spreadsheet_id: The ID of the spreadsheet.
             ranges: List of A1 notation ranges.
+            value_render_option: FORMATTED_VALUE, UNFORMATTED_VALUE or FORMULA
+                (see read_cells).
 
         Returns:
             Dictionary mapping range to values.
         """
+        if len(ranges) <= BATCH_GET_CHUNK_SIZE:
+            return self._batch_get(spreadsheet_id, ranges, value_render_option)
+
+        chunks = [
+            ranges[i : i + BATCH_GET_CHUNK_SIZE]
+            for i in range(0, len(ranges), BATCH_GET_CHUNK_SIZE)
+        ]
+        output: dict[str, list[list]] = {}
+        # map() yields in submission order, so ranges keep their order
+        fetch = functools.partial(
+            self._batch_get,
+            spreadsheet_id,
+            value_render_option=value_render_option,
+        )
+        for part in _batch_get_pool.map(fetch, chunks):
+            output.update(part)
+        return output
+
+    def _batch_get(
+        self,
+        spreadsheet_id: str,
+        ranges: list[str],
+        value_render_option: str = "FORMATTED_VALUE",
+    ) -> dict[str, list[list]]:
+        """Fetch one values.batchGet call worth of ranges."""
         result = self.values.batchGet(
             spreadsheetId=spreadsheet_id,
             ranges=ranges,
-            valueRenderOption="FORMATTED_VALUE",
-        ).execute()
+            valueRenderOption=value_render_option,
+        ).execute(num_retries=API_RETRIES)
 
         output = {}
         for value_range in result.get("valueRanges", []):
@@ -314,7 +1025,7 @@ class SheetsClient:
     def batch_write(
         self,
         spreadsheet_id: str,
-        data: list[dict],
+        data: list[BatchWriteItem],
         value_input_option: str = "USER_ENTERED",
     ) -> dict:
         """Write values to multiple ranges.
@@ -330,7 +1041,7 @@ class SheetsClient:
         result = self.values.batchUpdate(
             spreadsheetId=spreadsheet_id,
             body={"valueInputOption": value_input_option, "data": data},
-        ).execute()
+        ).execute(num_retries=API_RETRIES)
 
         return {
             "total_updated_cells": result.get("totalUpdatedCells", 0),
@@ -348,7 +1059,9 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        self.values.clear(spreadsheetId=spreadsheet_id, range=range_notation).execute()
+        self.values.clear(spreadsheetId=spreadsheet_id, range=range_notation).execute(
+            num_retries=API_RETRIES
+        )
         return True
 
     def append_rows(
@@ -376,6 +1089,7 @@ class SheetsClient:
             insertDataOption="INSERT_ROWS",
             body={"values": values},
         ).execute()
+        self._invalidate_metadata(spreadsheet_id)
 
         updates = result.get("updates", {})
         return {
@@ -402,26 +1116,17 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "insertDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "ROWS",
-                            "startIndex": start_index,
-                            "endIndex": start_index + num_rows,
-                        },
-                        "inheritFromBefore": start_index > 0,
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "insertDimension",
+            {
+                "range": _dimension_range(
+                    sheet_id, "ROWS", start_index, start_index + num_rows
+                ),
+                "inheritFromBefore": start_index > 0,
+            },
+            metadata_patch=_patch_inserted_dimension,
+        )
 
     def insert_columns(
         self, spreadsheet_id: str, sheet_id: int, start_index: int, num_columns: int
@@ -437,26 +1142,17 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "insertDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_index,
-                            "endIndex": start_index + num_columns,
-                        },
-                        "inheritFromBefore": start_index > 0,
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "insertDimension",
+            {
+                "range": _dimension_range(
+                    sheet_id, "COLUMNS", start_index, start_index + num_columns
+                ),
+                "inheritFromBefore": start_index > 0,
+            },
+            metadata_patch=_patch_inserted_dimension,
+        )
 
     def delete_rows(
         self, spreadsheet_id: str, sheet_id: int, start_index: int, num_rows: int
@@ -472,25 +1168,16 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "deleteDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "ROWS",
-                            "startIndex": start_index,
-                            "endIndex": start_index + num_rows,
-                        }
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "deleteDimension",
+            {
+                "range": _dimension_range(
+                    sheet_id, "ROWS", start_index, start_index + num_rows
+                )
+            },
+            metadata_patch=_patch_deleted_dimension,
+        )
 
     def delete_columns(
         self, spreadsheet_id: str, sheet_id: int, start_index: int, num_columns: int
@@ -506,25 +1193,16 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "deleteDimension": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_index,
-                            "endIndex": start_index + num_columns,
-                        }
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "deleteDimension",
+            {
+                "range": _dimension_range(
+                    sheet_id, "COLUMNS", start_index, start_index + num_columns
+                )
+            },
+            metadata_patch=_patch_deleted_dimension,
+        )
 
     # =========================================================================
     # Formatting
@@ -565,22 +1243,22 @@ class SheetsClient:
             True if successful.
         """
         cell_format: dict[str, Any] = {}
-        fields = []
+        field_bits = 0
 
         # Text format
         text_format: dict[str, Any] = {}
         if bold is not None:
             text_format["bold"] = bold
-            fields.append("userEnteredFormat.textFormat.bold")
+            field_bits |= 1
         if italic is not None:
             text_format["italic"] = italic
-            fields.append("userEnteredFormat.textFormat.italic")
+            field_bits |= 2
         if font_size is not None:
             text_format["fontSize"] = font_size
-            fields.append("userEnteredFormat.textFormat.fontSize")
+            field_bits |= 4
         if font_color is not None:
             text_format["foregroundColor"] = font_color
-            fields.append("userEnteredFormat.textFormat.foregroundColor")
+            field_bits |= 8
 
         if text_format:
             cell_format["textFormat"] = text_format
@@ -588,38 +1266,25 @@ class SheetsClient:
         # Background color
         if background_color is not None:
             cell_format["backgroundColor"] = background_color
-            fields.append("userEnteredFormat.backgroundColor")
+            field_bits |= 16
 
         # Alignment
         if horizontal_alignment is not None:
             cell_format["horizontalAlignment"] = horizontal_alignment
-            fields.append("userEnteredFormat.horizontalAlignment")
-
-        if not fields:
-            return True  # Nothing to format
-
-        request = {
-            "requests": [
-                {
-                    "repeatCell": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "cell": {"userEnteredFormat": cell_format},
-                        "fields": ",".join(fields),
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+            field_bits |= 32
+
+        if not field_bits:
+            return self._nothing_to_send(spreadsheet_id)
+
+        return self._run_op(
+            spreadsheet_id,
+            "repeatCell",
+            {
+                "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                "cell": {"userEnteredFormat": cell_format},
+                "fields": _FORMAT_FIELD_MASKS[field_bits],
+            },
+        )
 
     def set_column_width(
         self,
@@ -641,27 +1306,15 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "updateDimensionProperties": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "dimension": "COLUMNS",
-                            "startIndex": start_col,
-                            "endIndex": end_col,
-                        },
-                        "properties": {"pixelSize": width},
-                        "fields": "pixelSize",
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "updateDimensionProperties",
+            {
+                "range": _dimension_range(sheet_id, "COLUMNS", start_col, end_col),
+                "properties": {"pixelSize": width},
+                "fields": "pixelSize",
+            },
+        )
 
     def merge_cells(
         self,
@@ -687,27 +1340,14 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "mergeCells": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "mergeType": merge_type,
-                    }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id,
+            "mergeCells",
+            {
+                "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                "mergeType": merge_type,
+            },
+        )
 
     # =========================================================================
     # Charts
@@ -764,7 +1404,7 @@ class SheetsClient:
         position_row: int = 0,
         position_col: int = 0,
         domain_column: int = 0,
-        series_columns: list[int] | None = None,
+        series_columns: Sequence[int] | None = None,
     ) -> dict:
         """Create an embedded chart with multiple series support.
 
@@ -777,7 +1417,7 @@ class SheetsClient:
             position_row: Row offset for chart position.
             position_col: Column offset for chart position.
             domain_column: Column index for X-axis/domain (0-based, relative to data_range start).
-            series_columns: List of column indices for data series (0-based, relative to range).
+            series_columns: Column indices for data series (0-based, relative to range).
                            If None, auto-detects all columns after domain_column.
 
         Returns:
@@ -793,113 +1433,42 @@ class SheetsClient:
         if series_columns is None:
             # All columns after domain column
             num_cols = end_col - start_col
-            series_columns = [i for i in range(num_cols) if i != domain_column]
+            series_columns = tuple(i for i in range(num_cols) if i != domain_column)
         
-        # Build series list for multiple data columns
-        series_list = []
-        for col_idx in series_columns:
-            series_col_abs = start_col + col_idx
-            series_list.append({
-                "series": {
-                    "sourceRange": {
-                        "sources": [{
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": series_col_abs,
-                            "endColumnIndex": series_col_abs + 1,
-                        }]
-                    }
-                },
-                "targetAxis": "LEFT_AXIS",
-            })
-
-        chart_spec: dict[str, Any] = {
-            "title": title,
-            "basicChart": {
-                "chartType": chart_type.upper(),
-                "legendPosition": "BOTTOM_LEGEND",
-                "domains": [{
-                    "domain": {
-                        "sourceRange": {
-                            "sources": [{
-                                "sheetId": sheet_id,
-                                "startRowIndex": start_row,
-                                "endRowIndex": end_row,
-                                "startColumnIndex": domain_col_abs,
-                                "endColumnIndex": domain_col_abs + 1,
-                            }]
-                        }
-                    }
-                }],
-                "series": series_list,
-                "headerCount": 1,
-            },
-        }
+        series_cols = [start_col + col_idx for col_idx in series_columns]
+        chart_type = chart_type.upper()
+        build_spec = _CHART_SPEC_BUILDERS.get(chart_type, _basic_chart_spec)
+        chart_spec = build_spec(
+            chart_type, title, sheet_id, start_row, end_row, domain_col_abs, series_cols
+        )
 
-        # Special handling for PIE charts (only supports single series)
-        if chart_type.upper() == "PIE":
-            first_series_col = start_col + (series_columns[0] if series_columns else 1)
-            chart_spec = {
-                "title": title,
-                "pieChart": {
-                    "legendPosition": "RIGHT_LEGEND",
-                    "domain": {
-                        "sourceRange": {
-                            "sources": [{
+        def chart_info(reply: dict) -> dict:
+            chart = reply["addChart"]["chart"]
+            return {"chart_id": chart["chartId"], "position": chart.get("position", {})}
+
+        return self._run_op(
+            spreadsheet_id,
+            "addChart",
+            {
+                "chart": {
+                    "spec": chart_spec,
+                    "position": {
+                        "overlayPosition": {
+                            "anchorCell": {
                                 "sheetId": sheet_id,
-                                "startRowIndex": start_row,
-                                "endRowIndex": end_row,
-                                "startColumnIndex": domain_col_abs,
-                                "endColumnIndex": domain_col_abs + 1,
-                            }]
-                        }
-                    },
-                    "series": {
-                        "sourceRange": {
-                            "sources": [{
-                                "sheetId": sheet_id,
-                                "startRowIndex": start_row,
-                                "endRowIndex": end_row,
-                                "startColumnIndex": first_series_col,
-                                "endColumnIndex": first_series_col + 1,
-                            }]
-                        }
-                    },
-                },
-            }
-
-        request = {
-            "requests": [
-                {
-                    "addChart": {
-                        "chart": {
-                            "spec": chart_spec,
-                            "position": {
-                                "overlayPosition": {
-                                    "anchorCell": {
-                                        "sheetId": sheet_id,
-                                        "rowIndex": position_row,
-                                        "columnIndex": position_col,
-                                    },
-                                    "offsetXPixels": 0,
-                                    "offsetYPixels": 0,
-                                    "widthPixels": 600,
-                                    "heightPixels": 400,
-                                }
+                                "rowIndex": position_row,
+                                "columnIndex": position_col,
                             },
+                            "offsetXPixels": 0,
+                            "offsetYPixels": 0,
+                            "widthPixels": 600,
+                            "heightPixels": 400,
                         }
-                    }
+                    },
                 }
-            ]
-        }
-
-        result = self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-
-        chart = result["replies"][0]["addChart"]["chart"]
-        return {"chart_id": chart["chartId"], "position": chart.get("position", {})}
+            },
+            chart_info,
+        )
 
     def list_charts(self, spreadsheet_id: str) -> list[dict]:
         """List all charts in a spreadsheet.
@@ -910,7 +1479,9 @@ class SheetsClient:
         Returns:
             List of chart information.
         """
-        result = self.spreadsheets.get(spreadsheetId=spreadsheet_id).execute()
+        result = self.spreadsheets.get(
+            spreadsheetId=spreadsheet_id, fields=LIST_CHARTS_FIELDS
+        ).execute(num_retries=API_RETRIES)
         charts = []
 
         for sheet in result.get("sheets", []):
@@ -937,12 +1508,9 @@ class SheetsClient:
         Returns:
             True if successful.
         """
-        request = {"requests": [{"deleteEmbeddedObject": {"objectId": chart_id}}]}
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+        return self._run_op(
+            spreadsheet_id, "deleteEmbeddedObject", {"objectId": chart_id}
+        )
 
     # =========================================================================
     # Data Operations
@@ -968,38 +1536,32 @@ class SheetsClient:
             end_row: Ending row index (exclusive).
             start_col: Starting column index (0-based).
             end_col: Ending column index (exclusive).
-            sort_column: Column index to sort by (0-based).
+            sort_column: Absolute column index to sort by (0-based, not
+                relative to start_col); must be within the sorted columns.
             ascending: Sort order (True for ascending).
 
         Returns:
             True if successful.
         """
-        request = {
-            "requests": [
-                {
-                    "sortRange": {
-                        "range": {
-                            "sheetId": sheet_id,
-                            "startRowIndex": start_row,
-                            "endRowIndex": end_row,
-                            "startColumnIndex": start_col,
-                            "endColumnIndex": end_col,
-                        },
-                        "sortSpecs": [
-                            {
-                                "dimensionIndex": sort_column,
-                                "sortOrder": "ASCENDING" if ascending else "DESCENDING",
-                            }
-                        ],
+        if not start_col <= sort_column < end_col:
+            raise ValueError(
+                f"sort_column {sort_column} is outside columns {start_col}-{end_col}"
+                " (sort_column is an absolute sheet column index, not relative"
+                " to start_col)"
+            )
+        return self._run_op(
+            spreadsheet_id,
+            "sortRange",
+            {
+                "range": _grid_range(sheet_id, start_row, end_row, start_col, end_col),
+                "sortSpecs": [
+                    {
+                        "dimensionIndex": sort_column,
+                        "sortOrder": "ASCENDING" if ascending else "DESCENDING",
                     }
-                }
-            ]
-        }
-
-        self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
-        return True
+                ],
+            },
+        )
 
     def find_replace(
         self,
@@ -1036,18 +1598,108 @@ class SheetsClient:
         else:
             find_replace_request["allSheets"] = True
 
-        request = {"requests": [{"findReplace": find_replace_request}]}
+        def find_replace_info(reply: dict) -> dict:
+            fr_result = reply["findReplace"]
+            return {
+                "occurrences_changed": fr_result.get("occurrencesChanged", 0),
+                "rows_changed": fr_result.get("rowsChanged", 0),
+                "sheets_changed": fr_result.get("sheetsChanged", 0),
+                "values_changed": fr_result.get("valuesChanged", 0),
+            }
 
-        result = self.spreadsheets.batchUpdate(
-            spreadsheetId=spreadsheet_id, body=request
-        ).execute()
+        return self._run_op(
+            spreadsheet_id, "findReplace", find_replace_request, find_replace_info
+        )
+
+    def find_replace_many(
+        self,
+        spreadsheet_id: str,
+        range_notation: str,
+        pairs: Sequence[tuple[str, str]],
+        match_case: bool = False,
+        match_entire_cell: bool = False,
+    ) -> dict:
+        """Apply many find/replace pairs to a range in one read and one write.
+
+        Each find_replace is a full server-side scan, so N pairs cost N
+        scans. Here the range is read once, every find text is matched in a
+        single pass with one alternation regex (longest find first, so the
+        longest match wins where finds overlap), and only the changed cells
+        are written back. Unlike find_replace, only text cells are touched:
+        numbers, booleans and formulas are left as they are.
+
+        Args:
+            spreadsheet_id: The ID of the spreadsheet.
+            range_notation: A1 notation range to search (e.g., "Sheet1!A1:D100").
+            pairs: (find, replace) pairs. If a find text repeats, the last
+                pair wins.
+            match_case: Case-sensitive matching.
+            match_entire_cell: Match entire cell contents only.
+
+        Returns:
+            Result with number of replacements.
+        """
+        if not match_case:
+            pairs = [(find.lower(), replace) for find, replace in pairs]
+        replacements = dict(pairs)
+        if not replacements or "" in replacements:
+            raise ValueError("pairs must contain at least one non-empty find text")
+
+        # One named group per find text, so the replacement is picked by which
+        # group matched: IGNORECASE folds more characters than str.lower(),
+        # so the matched text itself can't be used as a key
+        finds = sorted(replacements, key=len, reverse=True)
+        pattern = re.compile(
+            "|".join(f"(?P<p{i}>{re.escape(find)})" for i, find in enumerate(finds)),
+            0 if match_case else re.IGNORECASE,
+        )
+        by_group = {f"p{i}": replacements[find] for i, find in enumerate(finds)}
+
+        def substitute(match: re.Match) -> str:
+            return by_group[match.lastgroup]
+
+        # FORMULA shows formulas as written, so they can be told apart from
+        # text and skipped
+        result = self.values.get(
+            spreadsheetId=spreadsheet_id,
+            range=range_notation,
+            valueRenderOption="FORMULA",
+        ).execute(num_retries=API_RETRIES)
+
+        # Unchanged cells stay None, which values.update skips
+        updates: list[list[str | None]] = []
+        occurrences = values_changed = rows_changed = 0
+        for row in result.get("values", []):
+            new_row: list[str | None] = []
+            for cell in row:
+                count = 0
+                if isinstance(cell, str) and not cell.startswith("="):
+                    if match_entire_cell:
+                        match = pattern.fullmatch(cell)
+                        if match:
+                            cell, count = substitute(match), 1
+                    else:
+                        cell, count = pattern.subn(substitute, cell)
+                occurrences += count
+                new_row.append(cell if count else None)
+            changed = sum(cell is not None for cell in new_row)
+            if changed:
+                values_changed += changed
+                rows_changed += 1
+            updates.append(new_row)
+
+        if values_changed:
+            self.values.update(
+                spreadsheetId=spreadsheet_id,
+                range=result["range"],
+                valueInputOption="RAW",
+                body={"values": updates},
+            ).execute(num_retries=API_RETRIES)
 
-        fr_result = result["replies"][0]["findReplace"]
         return {
-            "occurrences_changed": fr_result.get("occurrencesChanged", 0),
-            "rows_changed": fr_result.get("rowsChanged", 0),
-            "sheets_changed": fr_result.get("sheetsChanged", 0),
-            "values_changed": fr_result.get("valuesChanged", 0),
+            "occurrences_changed": occurrences,
+            "rows_changed": rows_changed,
+            "values_changed": values_changed,
         }
 
     def get_last_row(
@@ -1063,9 +1715,17 @@ class SheetsClient:
         Returns:
             Last row number with data (1-based), or 0 if empty.
         """
-        range_notation = f"{sheet_name}!{column}:{column}"
-        values = self.read_cells(spreadsheet_id, range_notation)
-        return len(values)
+        # One column as a single flat list: the API trims trailing blanks, so
+        # its length is the last row with data. Unformatted values skip the
+        # server-side formatting the answer doesn't need.
+        result = self.values.get(
+            spreadsheetId=spreadsheet_id,
+            range=f"{sheet_name}!{column}:{column}",
+            majorDimension="COLUMNS",
+            valueRenderOption="UNFORMATTED_VALUE",
+        ).execute(num_retries=API_RETRIES)
+        columns = result.get("values", [])
+        return len(columns[0]) if columns else 0
 
     # =========================================================================
     # Sharing
@@ -1089,8 +1749,6 @@ class SheetsClient:
         Returns:
             Result with permission details.
         """
-        drive = get_drive_service()
-
         if make_public:
             permission = {"type": "anyone", "role": role}
         elif email:
@@ -1098,15 +1756,11 @@ class SheetsClient:
         else:
             raise ValueError("Either email or make_public=True must be provided")
 
-        result = (
-            drive.permissions()
-            .create(
-                fileId=spreadsheet_id,
-                body=permission,
-                sendNotificationEmail=bool(email),
-            )
-            .execute()
-        )
+        result = self.permissions.create(
+            fileId=spreadsheet_id,
+            body=permission,
+            sendNotificationEmail=bool(email),
+        ).execute()
 
         return {
             "permission_id": result.get("id", ""),
@@ -2,7 +2,7 @@
 """Test all Google Sheets MCP tools."""
 
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from src.spreadsheet_mcp.sheets_client import get_client
 
 # Colors for output
@@ -12,18 +12,47 @@ YELLOW = "\033[93m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 
+# Line prefixes per status, composed once
+PASS_PREFIX = f"{GREEN}✓ "
+FAIL_PREFIX = f"{RED}✗ "
+INFO_PREFIX = f"{YELLOW}○ "
+
 def log_test(name: str, status: str, result: str = ""):
     if status == "PASS":
-        print(f"{GREEN}✓ {name}{RESET}")
+        print(PASS_PREFIX + name + RESET)
     elif status == "FAIL":
-        print(f"{RED}✗ {name}: {result}{RESET}")
+        print(FAIL_PREFIX + name + ": " + result + RESET)
     else:
-        print(f"{YELLOW}○ {name}: {result}{RESET}")
+        print(INFO_PREFIX + name + ": " + result + RESET)
+
+def check_batched(name: str, future, batch_error: Exception | None):
+    """Log a test whose request was queued in a client.batch() block."""
+    if future is None or future.cancelled():
+        log_test(name, "FAIL", f"not sent: {batch_error}")
+        return None
+    try:
+        result = future.result()
+    except Exception as e:
+        log_test(name, "FAIL", str(e))
+        return None
+    log_test(name, "PASS")
+    return result
+
+def run_parallel(executor, checks):
+    """Run independent checks at once, logging them in the order given."""
+    futures = [(name, executor.submit(check)) for name, check in checks]
+    for name, future in futures:
+        try:
+            future.result()
+            log_test(name, "PASS")
+        except Exception as e:
+            log_test(name, "FAIL", str(e))
 
 def main():
     print(f"\n{BOLD}=== Google Sheets MCP Server - Full Test Suite ==={RESET}\n")
     
     client = get_client()
+    executor = ThreadPoolExecutor(max_workers=8)
     spreadsheet_id = None
     sheet_id = None
     second_sheet_id = None
@@ -48,8 +77,6 @@ def main():
             log_test("create_spreadsheet", "FAIL", str(e))
             return
         
-        time.sleep(1)  # Rate limiting
-        
         # Test: get_spreadsheet_info
         try:
             result = client.get_spreadsheet_info(spreadsheet_id)
@@ -83,8 +110,6 @@ def main():
         except Exception as e:
             log_test("create_sheet", "FAIL", str(e))
         
-        time.sleep(0.5)
-        
         # Test: rename_sheet
         try:
             client.rename_sheet(spreadsheet_id, new_sheet_id, "RenamedSheet")
@@ -100,8 +125,6 @@ def main():
         except Exception as e:
             log_test("duplicate_sheet", "FAIL", str(e))
         
-        time.sleep(0.5)
-        
         # Test: delete_sheet
         try:
             client.delete_sheet(spreadsheet_id, dup_sheet_id)
@@ -111,253 +134,180 @@ def main():
         
         # =====================================================================
         # 3. CELL OPERATIONS
+        # Checks within a phase touch separate ranges, so they run at once;
+        # each phase waits for the one before it.
         # =====================================================================
         print(f"\n{BOLD}3. Cell Operations{RESET}")
-        
-        # Test: write_cells
-        try:
+
+        # Chart data for section 7 lives on TestSheet2, out of everyone's way
+        chart_data = executor.submit(
+            client.write_cells,
+            spreadsheet_id,
+            "TestSheet2!A1",
+            [
+                ["Month", "Sales"],
+                ["Jan", 100],
+                ["Feb", 150],
+                ["Mar", 120],
+                ["Apr", 200],
+                ["May", 180]
+            ]
+        )
+
+        def check_write_cells():
+            # Data and the formula column beside it go out in one call
             result = client.write_cells(
                 spreadsheet_id, 
                 "TestSheet1!A1",
                 [
-                    ["Name", "Age", "Score"],
-                    ["Alice", 25, 95],
-                    ["Bob", 30, 87],
-                    ["Charlie", 22, 92],
-                    ["Diana", 28, 88]
+                    ["Name", "Age", "Score", "Total"],
+                    ["Alice", 25, 95, "=B2+C2"],
+                    ["Bob", 30, 87, "=B3+C3"],
+                    ["Charlie", 22, 92, "=B4+C4"],
+                    ["Diana", 28, 88, "=B5+C5"]
                 ]
             )
-            assert result["updated_cells"] == 15
-            log_test("write_cells", "PASS")
-        except Exception as e:
-            log_test("write_cells", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: read_cells
-        try:
-            result = client.read_cells(spreadsheet_id, "TestSheet1!A1:C5")
-            assert len(result) == 5
-            assert result[0][0] == "Name"
-            assert result[1][0] == "Alice"
-            log_test("read_cells", "PASS")
-        except Exception as e:
-            log_test("read_cells", "FAIL", str(e))
-        
-        # Test: write formula
-        try:
-            result = client.write_cells(
+            assert result["updated_cells"] == 20
+
+        def check_batch_write():
+            result = client.batch_write(
                 spreadsheet_id,
-                "TestSheet1!D1",
                 [
-                    ["Total"],
-                    ["=B2+C2"],
-                    ["=B3+C3"],
-                    ["=B4+C4"],
-                    ["=B5+C5"]
+                    {"range": "TestSheet1!E1", "values": [["Category"]]},
+                    {"range": "TestSheet1!E2:E5", "values": [["A"], ["B"], ["A"], ["B"]]}
                 ]
             )
-            log_test("write_cells (formulas)", "PASS")
-        except Exception as e:
-            log_test("write_cells (formulas)", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: batch_read
-        try:
+            assert result["total_updated_cells"] == 5
+
+        def check_clear_cells():
+            # Write some data to clear
+            client.write_cells(spreadsheet_id, "TestSheet1!G1:G3", [["X"], ["Y"], ["Z"]])
+            client.clear_cells(spreadsheet_id, "TestSheet1!G1:G3")
+            result = client.read_cells(spreadsheet_id, "TestSheet1!G1:G3")
+            assert result == []
+
+        def check_read_cells():
+            result = client.read_cells(spreadsheet_id, "TestSheet1!A1:C5")
+            assert len(result) == 5
+            assert result[0][0] == "Name"
+            assert result[1][0] == "Alice"
+
+        def check_batch_read():
             result = client.batch_read(
                 spreadsheet_id,
                 ["TestSheet1!A1:A5", "TestSheet1!C1:C5"]
             )
             assert len(result) == 2
-            log_test("batch_read", "PASS")
-        except Exception as e:
-            log_test("batch_read", "FAIL", str(e))
-        
-        # Test: batch_write
-        try:
-            result = client.batch_write(
-                spreadsheet_id,
-                [
-                    {"range": "TestSheet1!E1", "values": [["Category"]]},
-                    {"range": "TestSheet1!E2:E5", "values": [["A"], ["B"], ["A"], ["B"]]}
-                ]
-            )
-            assert result["total_updated_cells"] == 5
-            log_test("batch_write", "PASS")
-        except Exception as e:
-            log_test("batch_write", "FAIL", str(e))
-        
-        # Test: append_rows
-        try:
-            result = client.append_rows(
+
+        def check_append_rows():
+            # Appends below the table, so it must already be written
+            client.append_rows(
                 spreadsheet_id,
                 "TestSheet1!A:E",
                 [["Eve", 26, 90, "=B6+C6", "A"]]
             )
-            log_test("append_rows", "PASS")
-        except Exception as e:
-            log_test("append_rows", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: get_last_row
-        try:
+
+        def check_get_last_row():
             result = client.get_last_row(spreadsheet_id, "TestSheet1", "A")
             assert result == 6  # Header + 5 data rows
-            log_test("get_last_row", "PASS")
-        except Exception as e:
-            log_test("get_last_row", "FAIL", str(e))
-        
-        # Test: clear_cells
-        try:
-            # Write some data to clear
-            client.write_cells(spreadsheet_id, "TestSheet1!G1:G3", [["X"], ["Y"], ["Z"]])
-            client.clear_cells(spreadsheet_id, "TestSheet1!G1:G3")
-            result = client.read_cells(spreadsheet_id, "TestSheet1!G1:G3")
-            assert result == []
-            log_test("clear_cells", "PASS")
-        except Exception as e:
-            log_test("clear_cells", "FAIL", str(e))
-        
-        # =====================================================================
-        # 4. ROW/COLUMN OPERATIONS
-        # =====================================================================
-        print(f"\n{BOLD}4. Row/Column Operations{RESET}")
-        
-        # Test: insert_rows
-        try:
-            client.insert_rows(spreadsheet_id, sheet_id, 2, 1)
-            log_test("insert_rows", "PASS")
-        except Exception as e:
-            log_test("insert_rows", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: delete_rows
-        try:
-            client.delete_rows(spreadsheet_id, sheet_id, 2, 1)
-            log_test("delete_rows", "PASS")
-        except Exception as e:
-            log_test("delete_rows", "FAIL", str(e))
-        
-        # Test: insert_columns
-        try:
-            client.insert_columns(spreadsheet_id, sheet_id, 5, 1)
-            log_test("insert_columns", "PASS")
-        except Exception as e:
-            log_test("insert_columns", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: delete_columns
-        try:
-            client.delete_columns(spreadsheet_id, sheet_id, 5, 1)
-            log_test("delete_columns", "PASS")
-        except Exception as e:
-            log_test("delete_columns", "FAIL", str(e))
-        
-        # =====================================================================
-        # 5. FORMATTING
-        # =====================================================================
-        print(f"\n{BOLD}5. Formatting{RESET}")
-        
-        # Test: format_cells (header bold with background)
-        try:
-            client.format_cells(
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                start_row=0,
-                end_row=1,
-                start_col=0,
-                end_col=5,
-                bold=True,
-                background_color={"red": 0.26, "green": 0.52, "blue": 0.96},  # Google Blue
-                font_color={"red": 1, "green": 1, "blue": 1}  # White text
-            )
-            log_test("format_cells (bold + colors)", "PASS")
-        except Exception as e:
-            log_test("format_cells", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: set_column_width
-        try:
-            client.set_column_width(spreadsheet_id, sheet_id, 0, 1, 150)
-            log_test("set_column_width", "PASS")
-        except Exception as e:
-            log_test("set_column_width", "FAIL", str(e))
-        
-        # Test: merge_cells
-        try:
-            # Write a title to merge
-            client.write_cells(spreadsheet_id, "TestSheet1!A10", [["Merged Title"]])
-            client.merge_cells(spreadsheet_id, sheet_id, 9, 10, 0, 3)
-            log_test("merge_cells", "PASS")
-        except Exception as e:
-            log_test("merge_cells", "FAIL", str(e))
+
+        run_parallel(executor, [
+            ("write_cells (values + formulas)", check_write_cells),
+            ("batch_write", check_batch_write),
+            ("clear_cells", check_clear_cells),
+        ])
+        run_parallel(executor, [
+            ("read_cells", check_read_cells),
+            ("batch_read", check_batch_read),
+            ("append_rows", check_append_rows),
+        ])
+        run_parallel(executor, [("get_last_row", check_get_last_row)])
         
         # =====================================================================
-        # 6. DATA OPERATIONS
+        # 4-6. ROW/COLUMN, FORMATTING AND DATA OPERATIONS
+        # Queued inside client.batch() and sent as one batchUpdate; each
+        # result is checked once the batch has gone out.
         # =====================================================================
-        print(f"\n{BOLD}6. Data Operations{RESET}")
-        
-        # Test: sort_range
-        try:
-            # Sort data by Age (column B, index 1)
-            client.sort_range(
-                spreadsheet_id=spreadsheet_id,
-                sheet_id=sheet_id,
-                start_row=1,  # Skip header
-                end_row=7,
-                start_col=0,
-                end_col=5,
-                sort_column=1,  # Age column
-                ascending=True
-            )
-            log_test("sort_range", "PASS")
-        except Exception as e:
-            log_test("sort_range", "FAIL", str(e))
-        
-        time.sleep(0.5)
-        
-        # Test: find_replace
+        batched = {}
+        batch_error = None
         try:
-            result = client.find_replace(
-                spreadsheet_id=spreadsheet_id,
-                find="A",
-                replace="Category A",
-                sheet_id=sheet_id
-            )
-            log_test("find_replace", "PASS")
-            print(f"   Replaced {result['occurrences_changed']} occurrences")
+            with client.batch(spreadsheet_id):
+                batched["insert_rows"] = client.insert_rows(spreadsheet_id, sheet_id, 2, 1)
+                batched["delete_rows"] = client.delete_rows(spreadsheet_id, sheet_id, 2, 1)
+                batched["insert_columns"] = client.insert_columns(
+                    spreadsheet_id, sheet_id, 5, 1
+                )
+                batched["delete_columns"] = client.delete_columns(
+                    spreadsheet_id, sheet_id, 5, 1
+                )
+
+                # Header bold with background
+                batched["format_cells (bold + colors)"] = client.format_cells(
+                    spreadsheet_id=spreadsheet_id,
+                    sheet_id=sheet_id,
+                    start_row=0,
+                    end_row=1,
+                    start_col=0,
+                    end_col=5,
+                    bold=True,
+                    background_color={"red": 0.26, "green": 0.52, "blue": 0.96},  # Google Blue
+                    font_color={"red": 1, "green": 1, "blue": 1}  # White text
+                )
+                batched["set_column_width"] = client.set_column_width(
+                    spreadsheet_id, sheet_id, 0, 1, 150
+                )
+
+                # Write a title to merge (a values call, so it is sent right away)
+                client.write_cells(spreadsheet_id, "TestSheet1!A10", [["Merged Title"]])
+                batched["merge_cells"] = client.merge_cells(
+                    spreadsheet_id, sheet_id, 9, 10, 0, 3
+                )
+
+                # Sort data by Age (column B, index 1)
+                batched["sort_range"] = client.sort_range(
+                    spreadsheet_id=spreadsheet_id,
+                    sheet_id=sheet_id,
+                    start_row=1,  # Skip header
+                    end_row=7,
+                    start_col=0,
+                    end_col=5,
+                    sort_column=1,  # Age column
+                    ascending=True
+                )
+                batched["find_replace"] = client.find_replace(
+                    spreadsheet_id=spreadsheet_id,
+                    find="A",
+                    replace="Category A",
+                    sheet_id=sheet_id
+                )
         except Exception as e:
-            log_test("find_replace", "FAIL", str(e))
+            batch_error = e
+
+        sections = [
+            ("4. Row/Column Operations",
+             ["insert_rows", "delete_rows", "insert_columns", "delete_columns"]),
+            ("5. Formatting",
+             ["format_cells (bold + colors)", "set_column_width", "merge_cells"]),
+            ("6. Data Operations", ["sort_range", "find_replace"]),
+        ]
+        for title, names in sections:
+            print(f"\n{BOLD}{title}{RESET}")
+            for name in names:
+                result = check_batched(name, batched.get(name), batch_error)
+                if name == "find_replace" and result is not None:
+                    print(f"   Replaced {result['occurrences_changed']} occurrences")
         
         # =====================================================================
         # 7. CHARTS
         # =====================================================================
         print(f"\n{BOLD}7. Charts{RESET}")
         
-        # First, add clean data for chart
+        # Chart data was written in the background during section 3
         try:
-            client.write_cells(
-                spreadsheet_id,
-                "TestSheet2!A1",
-                [
-                    ["Month", "Sales"],
-                    ["Jan", 100],
-                    ["Feb", 150],
-                    ["Mar", 120],
-                    ["Apr", 200],
-                    ["May", 180]
-                ]
-            )
+            chart_data.result()
         except Exception as e:
             print(f"   Warning: Could not prepare chart data: {e}")
         
-        time.sleep(0.5)
-        
         # Test: create_chart
         try:
             result = client.create_chart(
@@ -373,8 +323,6 @@ def main():
         except Exception as e:
             log_test("create_chart", "FAIL", str(e))
         
-        time.sleep(0.5)
-        
         # Test: list_charts
         try:
             result = client.list_charts(spreadsheet_id)
@@ -404,9 +352,9 @@ def main():
         print(f"\n{RED}Unexpected error: {e}{RESET}")
         raise
     finally:
+        executor.shutdown()
         # Optionally delete the test spreadsheet
         # (leaving it so user can inspect)
-        pass
 
 
 if __name__ == "__main__":
@@ -2,24 +2,93 @@
 """Test all Google Sheets MCP tools using an existing spreadsheet."""
 
 import json
+import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from src.spreadsheet_mcp.sheets_client import get_client
 
-# Colors for output
-GREEN = "\033[92m"
-RED = "\033[91m"
-YELLOW = "\033[93m"
-RESET = "\033[0m"
-BOLD = "\033[1m"
+# The batch_execute check only runs with SPREADSHEET_MCP_GZIP_REQUESTS=1, so
+# the rest of the suite tests the default (uncompressed) configuration
+GZIP_REQUESTS = os.environ.get("SPREADSHEET_MCP_GZIP_REQUESTS", "0") == "1"
+
+# Colors for output, left out when stdout is piped or redirected
+def color(code: str) -> str:
+    return code if sys.stdout.isatty() else ""
+
+GREEN = color("\033[92m")
+RED = color("\033[91m")
+YELLOW = color("\033[93m")
+RESET = color("\033[0m")
+BOLD = color("\033[1m")
+
+# Line template per status, composed once; anything else is shown as info
+LOG_FORMATS = {
+    "PASS": f"{GREEN}✓ {{name}}{RESET}",
+    "FAIL": f"{RED}✗ {{name}}: {{result}}{RESET}",
+}
+INFO_FORMAT = f"{YELLOW}○ {{name}}: {{result}}{RESET}"
 
 def log_test(name: str, status: str, result: str = ""):
-    if status == "PASS":
-        print(f"{GREEN}✓ {name}{RESET}")
-    elif status == "FAIL":
-        print(f"{RED}✗ {name}: {result}{RESET}")
-    else:
-        print(f"{YELLOW}○ {name}: {result}{RESET}")
+    print(LOG_FORMATS.get(status, INFO_FORMAT).format(name=name, result=result))
+
+def run_batched(client, spreadsheet_id, calls):
+    """Run (name, call) pairs inside one client.batch(); map name -> (result, error).
+
+    batchUpdate is all-or-nothing, so if the batch is rejected nothing was
+    applied, and each call is run again on its own to see which one failed.
+    """
+    futures = {}
+    try:
+        with client.batch(spreadsheet_id):
+            for name, call in calls:
+                futures[name] = call()
+    except Exception:
+        outcomes = {}
+        for name, call in calls:
+            try:
+                outcomes[name] = (call(), None)
+            except Exception as e:
+                outcomes[name] = (None, e)
+        return outcomes
+    return {
+        name: (future.result(), None)
+        for name, future in futures.items()
+    }
+
+def report(name, outcome):
+    """Log a (result, error) outcome from run_batched; True if it passed."""
+    result, error = outcome
+    if error is None:
+        log_test(name, "PASS")
+        return True
+    log_test(name, "FAIL", str(error))
+    return False
+
+def run_check(name, check):
+    """Run one check and log it; True if it passed.
+
+    A check fails by raising; a string it returns is printed under its result.
+    """
+    try:
+        note = check()
+    except Exception as e:
+        log_test(name, "FAIL", str(e))
+        return False
+    log_test(name, "PASS")
+    if note:
+        print(note)
+    return True
+
+def run_sequential(checks):
+    """Run checks one after another on this thread; return (passed, failed)."""
+    passed = sum(run_check(name, check) for name, check in checks)
+    return passed, len(checks) - passed
+
+def run_parallel(executor, checks):
+    """Run independent checks at once and log them in order; return (passed, failed)."""
+    futures = [(name, executor.submit(check)) for name, check in checks]
+    passed = sum(run_check(name, future.result) for name, future in futures)
+    return passed, len(futures) - passed
 
 def main():
     if len(sys.argv) < 2:
@@ -36,9 +105,9 @@ def main():
     print(f"Testing with spreadsheet: {spreadsheet_id}\n")
     
     client = get_client()
+    executor = ThreadPoolExecutor(max_workers=8)
     sheet_id = None
     test_sheet_id = None
-    chart_id = None
     passed = 0
     failed = 0
     
@@ -48,43 +117,51 @@ def main():
         # =====================================================================
         print(f"\n{BOLD}1. Spreadsheet Management{RESET}")
         
-        # Test: get_spreadsheet_info
-        try:
-            result = client.get_spreadsheet_info(spreadsheet_id)
-            sheet_id = result["sheets"][0]["sheet_id"]
-            print(f"   Title: {result['title']}")
-            print(f"   Sheets: {[s['title'] for s in result['sheets']]}")
-            log_test("get_spreadsheet_info", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("get_spreadsheet_info", "FAIL", str(e))
-            failed += 1
+        info = {}
+        
+        def check_spreadsheet_info():
+            info.update(client.get_spreadsheet_info(spreadsheet_id))
+            return (
+                f"   Title: {info['title']}\n"
+                f"   Sheets: {[s['title'] for s in info['sheets']]}"
+            )
+        
+        phase_passed, phase_failed = run_sequential(
+            [("get_spreadsheet_info", check_spreadsheet_info)]
+        )
+        passed += phase_passed
+        failed += phase_failed
+        if phase_failed:
             print(f"\n{RED}Cannot access spreadsheet. Make sure you shared it with your service account email.{RESET}")
             print("Find your service account email in credentials/service-account.json (client_email field)")
             return
+        sheet_id = info["sheets"][0]["sheet_id"]
         
         # =====================================================================
         # 2. SHEET MANAGEMENT
         # =====================================================================
         print(f"\n{BOLD}2. Sheet Management{RESET}")
         
-        # Test: list_sheets
-        try:
-            result = client.list_sheets(spreadsheet_id)
-            log_test("list_sheets", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("list_sheets", "FAIL", str(e))
-            failed += 1
+        def check_list_sheets():
+            client.list_sheets(spreadsheet_id)
+        
+        phase_passed, phase_failed = run_sequential([("list_sheets", check_list_sheets)])
+        passed += phase_passed
+        failed += phase_failed
+        
+        # create_sheet and duplicate_sheet go out as one batchUpdate, then
+        # rename_sheet and delete_sheet, which need the new sheet IDs, as another
+        outcomes = run_batched(client, spreadsheet_id, [
+            ("create_sheet", lambda: client.create_sheet(spreadsheet_id, "MCPTestSheet")),
+            ("duplicate_sheet",
+             lambda: client.duplicate_sheet(spreadsheet_id, sheet_id, "DuplicatedSheet")),
+        ])
         
         # Test: create_sheet
-        try:
-            result = client.create_sheet(spreadsheet_id, "MCPTestSheet")
-            test_sheet_id = result["sheet_id"]
-            log_test("create_sheet", "PASS")
+        if report("create_sheet", outcomes["create_sheet"]):
+            test_sheet_id = outcomes["create_sheet"][0]["sheet_id"]
             passed += 1
-        except Exception as e:
-            log_test("create_sheet", "FAIL", str(e))
+        else:
             failed += 1
             # Try to find existing test sheet
             try:
@@ -96,39 +173,27 @@ def main():
             except:
                 pass
         
-        time.sleep(0.5)
-        
-        # Test: rename_sheet
-        if test_sheet_id:
-            try:
-                client.rename_sheet(spreadsheet_id, test_sheet_id, "MCPTestRenamed")
-                log_test("rename_sheet", "PASS")
-                passed += 1
-            except Exception as e:
-                log_test("rename_sheet", "FAIL", str(e))
-                failed += 1
-        
         # Test: duplicate_sheet
         dup_sheet_id = None
-        try:
-            result = client.duplicate_sheet(spreadsheet_id, sheet_id, "DuplicatedSheet")
-            dup_sheet_id = result["sheet_id"]
-            log_test("duplicate_sheet", "PASS")
+        if report("duplicate_sheet", outcomes["duplicate_sheet"]):
+            dup_sheet_id = outcomes["duplicate_sheet"][0]["sheet_id"]
             passed += 1
-        except Exception as e:
-            log_test("duplicate_sheet", "FAIL", str(e))
+        else:
             failed += 1
         
-        time.sleep(0.5)
-        
-        # Test: delete_sheet (delete the duplicated one)
+        # Test: rename_sheet, delete_sheet (delete the duplicated one)
+        calls = []
+        if test_sheet_id:
+            calls.append(("rename_sheet", lambda: client.rename_sheet(
+                spreadsheet_id, test_sheet_id, "MCPTestRenamed"
+            )))
         if dup_sheet_id:
-            try:
-                client.delete_sheet(spreadsheet_id, dup_sheet_id)
-                log_test("delete_sheet", "PASS")
+            calls.append(("delete_sheet",
+                          lambda: client.delete_sheet(spreadsheet_id, dup_sheet_id)))
+        for name, outcome in run_batched(client, spreadsheet_id, calls).items():
+            if report(name, outcome):
                 passed += 1
-            except Exception as e:
-                log_test("delete_sheet", "FAIL", str(e))
+            else:
                 failed += 1
         
         # =====================================================================
@@ -138,12 +203,16 @@ def main():
         
         work_sheet = test_sheet_id if test_sheet_id else sheet_id
         sheet_name = "MCPTestRenamed" if test_sheet_id else "Sheet1"
+        prefix = sheet_name + "!"
+        scratch_range = prefix + "G1:G3"
+        bulk_range = prefix + "J1:J100"
         
-        # Test: write_cells
-        try:
+        # Checks within a phase touch separate ranges, so they run at once;
+        # each phase waits for the one before it
+        def check_write_cells():
             result = client.write_cells(
                 spreadsheet_id, 
-                f"{sheet_name}!A1",
+                prefix + "A1",
                 [
                     ["Name", "Age", "Score"],
                     ["Alice", 25, 95],
@@ -153,173 +222,130 @@ def main():
                 ]
             )
             assert result["updated_cells"] == 15
-            log_test("write_cells", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("write_cells", "FAIL", str(e))
-            failed += 1
-        
-        time.sleep(0.5)
-        
-        # Test: read_cells
-        try:
-            result = client.read_cells(spreadsheet_id, f"{sheet_name}!A1:C5")
-            assert len(result) == 5
-            assert result[0][0] == "Name"
-            log_test("read_cells", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("read_cells", "FAIL", str(e))
-            failed += 1
         
-        # Test: write formula
-        try:
+        def check_write_formulas():
+            # Runs after write_cells so the inputs are in place; the write's
+            # reply carries the computed values, so no read-back
             result = client.write_cells(
                 spreadsheet_id,
-                f"{sheet_name}!D1",
+                prefix + "D1",
                 [
                     ["Total"],
                     ["=B2+C2"],
                     ["=B3+C3"],
                     ["=B4+C4"],
                     ["=B5+C5"]
-                ]
+                ],
+                include_values_in_response=True,
+                response_value_render_option="UNFORMATTED_VALUE",
             )
-            log_test("write_cells (formulas)", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("write_cells (formulas)", "FAIL", str(e))
-            failed += 1
-        
-        time.sleep(0.5)
-        
-        # Verify formula results
-        try:
-            result = client.read_cells(spreadsheet_id, f"{sheet_name}!D2:D5")
             # Should have computed values (120, 117, 114, 116)
-            print(f"   Formula results: {[row[0] for row in result]}")
-        except:
-            pass
+            totals = [row[0] for row in result["updated_values"][1:]]
+            return f"   Formula results: {totals}"
         
-        # Test: batch_read
-        try:
-            result = client.batch_read(
-                spreadsheet_id,
-                [f"{sheet_name}!A1:A5", f"{sheet_name}!C1:C5"]
-            )
-            assert len(result) == 2
-            log_test("batch_read", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("batch_read", "FAIL", str(e))
-            failed += 1
-        
-        # Test: batch_write
-        try:
+        def check_batch_write():
             result = client.batch_write(
                 spreadsheet_id,
                 [
-                    {"range": f"{sheet_name}!E1", "values": [["Category"]]},
-                    {"range": f"{sheet_name}!E2:E5", "values": [["A"], ["B"], ["A"], ["B"]]}
+                    {"range": prefix + "E1", "values": [["Category"]]},
+                    {"range": prefix + "E2:E5", "values": [["A"], ["B"], ["A"], ["B"]]},
+                    # Data for the clear_cells check to clear
+                    {"range": scratch_range, "values": [["X"], ["Y"], ["Z"]]}
                 ]
             )
-            assert result["total_updated_cells"] == 5
-            log_test("batch_write", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("batch_write", "FAIL", str(e))
-            failed += 1
+            assert result["total_updated_cells"] == 8
+        
+        def check_batch_execute():
+            # Over GZIP_MIN_BODY_BYTES, so this round-trips a body that would
+            # be compressed if it were sent on its own (gzip on only)
+            rows = [[f"batched row {i:03d} " + "x" * 40] for i in range(100)]
+            (update,) = client.batch_execute([
+                client.values.update(
+                    spreadsheetId=spreadsheet_id,
+                    range=bulk_range,
+                    valueInputOption="RAW",
+                    body={"values": rows},
+                )
+            ])
+            if isinstance(update, Exception):
+                raise update
+            assert client.read_cells(spreadsheet_id, bulk_range) == rows
+        
+        def check_clear_cells():
+            # G1:G3 was filled by batch_write
+            client.clear_cells(spreadsheet_id, scratch_range)
+            result = client.read_cells(spreadsheet_id, scratch_range)
+            assert result == []
+        
+        def check_read_cells():
+            result = client.read_cells(spreadsheet_id, prefix + "A1:C5")
+            assert len(result) == 5
+            assert result[0][0] == "Name"
         
-        # Test: append_rows
-        try:
-            result = client.append_rows(
+        def check_batch_read():
+            result = client.batch_read(
                 spreadsheet_id,
-                f"{sheet_name}!A:E",
-                [["Eve", 26, 90, "=B6+C6", "A"]]
+                [prefix + "A1:A5", prefix + "C1:C5"]
             )
-            log_test("append_rows", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("append_rows", "FAIL", str(e))
-            failed += 1
+            assert len(result) == 2
         
-        time.sleep(0.5)
+        def check_append_rows():
+            # Appends below the table, so it must already be written
+            client.append_rows(
+                spreadsheet_id,
+                prefix + "A:E",
+                [["Eve", 26, 90, "=B6+C6", "A"]]
+            )
         
-        # Test: get_last_row
-        try:
+        def check_get_last_row():
             result = client.get_last_row(spreadsheet_id, sheet_name, "A")
             assert result >= 5
-            log_test("get_last_row", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("get_last_row", "FAIL", str(e))
-            failed += 1
-        
-        # Test: clear_cells
-        try:
-            client.write_cells(spreadsheet_id, f"{sheet_name}!G1:G3", [["X"], ["Y"], ["Z"]])
-            client.clear_cells(spreadsheet_id, f"{sheet_name}!G1:G3")
-            result = client.read_cells(spreadsheet_id, f"{sheet_name}!G1:G3")
-            assert result == []
-            log_test("clear_cells", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("clear_cells", "FAIL", str(e))
-            failed += 1
-        
-        # =====================================================================
-        # 4. ROW/COLUMN OPERATIONS
-        # =====================================================================
-        print(f"\n{BOLD}4. Row/Column Operations{RESET}")
-        
-        # Test: insert_rows
-        try:
-            client.insert_rows(spreadsheet_id, work_sheet, 2, 1)
-            log_test("insert_rows", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("insert_rows", "FAIL", str(e))
-            failed += 1
-        
-        time.sleep(0.5)
-        
-        # Test: delete_rows
-        try:
-            client.delete_rows(spreadsheet_id, work_sheet, 2, 1)
-            log_test("delete_rows", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("delete_rows", "FAIL", str(e))
-            failed += 1
-        
-        # Test: insert_columns
-        try:
-            client.insert_columns(spreadsheet_id, work_sheet, 5, 1)
-            log_test("insert_columns", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("insert_columns", "FAIL", str(e))
-            failed += 1
         
-        time.sleep(0.5)
-        
-        # Test: delete_columns
-        try:
-            client.delete_columns(spreadsheet_id, work_sheet, 5, 1)
-            log_test("delete_columns", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("delete_columns", "FAIL", str(e))
-            failed += 1
+        first_writes = [
+            ("write_cells", check_write_cells),
+            ("batch_write", check_batch_write),
+        ]
+        if GZIP_REQUESTS:
+            first_writes.append(("batch_execute (large body)", check_batch_execute))
+        else:
+            log_test(
+                "batch_execute (large body)",
+                "SKIP",
+                "set SPREADSHEET_MCP_GZIP_REQUESTS=1 to run",
+            )
+        for checks in (
+            first_writes,
+            [
+                ("write_cells (formulas)", check_write_formulas),
+                ("read_cells", check_read_cells),
+                ("batch_read", check_batch_read),
+                ("append_rows", check_append_rows),
+                ("clear_cells", check_clear_cells),
+            ],
+            [("get_last_row", check_get_last_row)],
+        ):
+            phase_passed, phase_failed = run_parallel(executor, checks)
+            passed += phase_passed
+            failed += phase_failed
         
         # =====================================================================
-        # 5. FORMATTING
+        # 4-6. ROW/COLUMN, FORMATTING AND DATA OPERATIONS
+        # Sent as one batchUpdate; each result is reported once it is back.
         # =====================================================================
-        print(f"\n{BOLD}5. Formatting{RESET}")
-        
-        # Test: format_cells (header bold with background)
-        try:
-            client.format_cells(
+        def merge_title():
+            # Write a title to merge (a values call, so it is sent right away)
+            client.write_cells(spreadsheet_id, prefix + "A10", [["Merged Title"]])
+            return client.merge_cells(spreadsheet_id, work_sheet, 9, 10, 0, 3)
+        
+        outcomes = run_batched(client, spreadsheet_id, [
+            ("insert_rows", lambda: client.insert_rows(spreadsheet_id, work_sheet, 2, 1)),
+            ("delete_rows", lambda: client.delete_rows(spreadsheet_id, work_sheet, 2, 1)),
+            ("insert_columns",
+             lambda: client.insert_columns(spreadsheet_id, work_sheet, 5, 1)),
+            ("delete_columns",
+             lambda: client.delete_columns(spreadsheet_id, work_sheet, 5, 1)),
+            # Header bold with background
+            ("format_cells (bold + colors)", lambda: client.format_cells(
                 spreadsheet_id=spreadsheet_id,
                 sheet_id=work_sheet,
                 start_row=0,
@@ -329,42 +355,11 @@ def main():
                 bold=True,
                 background_color={"red": 0.26, "green": 0.52, "blue": 0.96},
                 font_color={"red": 1, "green": 1, "blue": 1}
-            )
-            log_test("format_cells (bold + colors)", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("format_cells", "FAIL", str(e))
-            failed += 1
-        
-        time.sleep(0.5)
-        
-        # Test: set_column_width
-        try:
-            client.set_column_width(spreadsheet_id, work_sheet, 0, 1, 150)
-            log_test("set_column_width", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("set_column_width", "FAIL", str(e))
-            failed += 1
-        
-        # Test: merge_cells
-        try:
-            client.write_cells(spreadsheet_id, f"{sheet_name}!A10", [["Merged Title"]])
-            client.merge_cells(spreadsheet_id, work_sheet, 9, 10, 0, 3)
-            log_test("merge_cells", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("merge_cells", "FAIL", str(e))
-            failed += 1
-        
-        # =====================================================================
-        # 6. DATA OPERATIONS
-        # =====================================================================
-        print(f"\n{BOLD}6. Data Operations{RESET}")
-        
-        # Test: sort_range
-        try:
-            client.sort_range(
+            )),
+            ("set_column_width",
+             lambda: client.set_column_width(spreadsheet_id, work_sheet, 0, 1, 150)),
+            ("merge_cells", merge_title),
+            ("sort_range", lambda: client.sort_range(
                 spreadsheet_id=spreadsheet_id,
                 sheet_id=work_sheet,
                 start_row=1,
@@ -373,75 +368,72 @@ def main():
                 end_col=5,
                 sort_column=1,
                 ascending=True
-            )
-            log_test("sort_range", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("sort_range", "FAIL", str(e))
-            failed += 1
-        
-        time.sleep(0.5)
-        
-        # Test: find_replace
-        try:
-            result = client.find_replace(
+            )),
+            ("find_replace", lambda: client.find_replace(
                 spreadsheet_id=spreadsheet_id,
                 find="A",
                 replace="Category A",
                 sheet_id=work_sheet
-            )
-            log_test("find_replace", "PASS")
-            passed += 1
-            if result['occurrences_changed'] > 0:
-                print(f"   Replaced {result['occurrences_changed']} occurrences")
-        except Exception as e:
-            log_test("find_replace", "FAIL", str(e))
-            failed += 1
+            )),
+        ])
+        
+        sections = [
+            ("4. Row/Column Operations",
+             ["insert_rows", "delete_rows", "insert_columns", "delete_columns"]),
+            ("5. Formatting",
+             ["format_cells (bold + colors)", "set_column_width", "merge_cells"]),
+            ("6. Data Operations", ["sort_range", "find_replace"]),
+        ]
+        for title, names in sections:
+            print(f"\n{BOLD}{title}{RESET}")
+            for name in names:
+                if report(name, outcomes[name]):
+                    passed += 1
+                else:
+                    failed += 1
+        
+        result = outcomes["find_replace"][0]
+        if result and result['occurrences_changed'] > 0:
+            print(f"   Replaced {result['occurrences_changed']} occurrences")
         
         # =====================================================================
         # 7. CHARTS
         # =====================================================================
         print(f"\n{BOLD}7. Charts{RESET}")
         
-        # Test: create_chart
-        try:
-            result = client.create_chart(
+        # Each chart check needs the one before it, so they run one at a time
+        charts = {}
+        
+        def check_create_chart():
+            charts["id"] = client.create_chart(
                 spreadsheet_id=spreadsheet_id,
                 sheet_id=work_sheet,
                 chart_type="COLUMN",
-                data_range=f"{sheet_name}!A1:C6",
+                data_range=prefix + "A1:C6",
                 title="Age vs Score",
                 position_row=0,
                 position_col=7
+            )["chart_id"]
+        
+        def check_list_charts():
+            return f"   Found {len(client.list_charts(spreadsheet_id))} chart(s)"
+        
+        def check_delete_chart():
+            client.delete_chart(spreadsheet_id, charts["id"])
+        
+        chart_checks = [
+            ("create_chart", check_create_chart),
+            ("list_charts", check_list_charts),
+        ]
+        phase_passed, phase_failed = run_sequential(chart_checks)
+        passed += phase_passed
+        failed += phase_failed
+        if "id" in charts:
+            phase_passed, phase_failed = run_sequential(
+                [("delete_chart", check_delete_chart)]
             )
-            chart_id = result["chart_id"]
-            log_test("create_chart", "PASS")
-            passed += 1
-        except Exception as e:
-            log_test("create_chart", "FAIL", str(e))
-            failed += 1
-        
-        time.sleep(0.5)
-        
-        # Test: list_charts
-        try:
-            result = client.list_charts(spreadsheet_id)
-            log_test("list_charts", "PASS")
-            passed += 1
-            print(f"   Found {len(result)} chart(s)")
-        except Exception as e:
-            log_test("list_charts", "FAIL", str(e))
-            failed += 1
-        
-        # Test: delete_chart
-        if chart_id:
-            try:
-                client.delete_chart(spreadsheet_id, chart_id)
-                log_test("delete_chart", "PASS")
-                passed += 1
-            except Exception as e:
-                log_test("delete_chart", "FAIL", str(e))
-                failed += 1
+            passed += phase_passed
+            failed += phase_failed
         
         # =====================================================================
         # SUMMARY
@@ -459,6 +451,8 @@ def main():
     except Exception as e:
         print(f"\n{RED}Unexpected error: {e}{RESET}")
         raise
+    finally:
+        executor.shutdown()
 
 
 if __name__ == "__main__":